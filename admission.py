@@ -0,0 +1,193 @@
+import os
+import math
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Dict, Any
+
+# Admission control for /match: at most `limit` pipelines run at once, at most
+# `max_queue` wait for a slot, everything else gets a fast 503 + Retry-After.
+# The limit adapts to the LLM: it backs off multiplicatively on 429s and when
+# LLM latency goes over target, and creeps back up (additive increase) otherwise.
+ADMISSION_MAX_CONCURRENCY = int(os.getenv("ADMISSION_MAX_CONCURRENCY", "8"))
+ADMISSION_MIN_CONCURRENCY = int(os.getenv("ADMISSION_MIN_CONCURRENCY", "1"))
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "32"))
+ADMISSION_TARGET_LLM_LATENCY_S = float(os.getenv("ADMISSION_TARGET_LLM_LATENCY_S", "5"))
+ADMISSION_DEFAULT_TIMEOUT_S = float(os.getenv("ADMISSION_DEFAULT_TIMEOUT_S", "60"))
+# Upper bound for client-supplied X-Request-Timeout-Ms
+ADMISSION_MAX_TIMEOUT_S = float(os.getenv("ADMISSION_MAX_TIMEOUT_S", "300"))
+
+
+def parse_timeout_ms(value: str = None) -> float:
+    """
+    Client timeout header -> seconds. Missing means the server default; the value
+    must be a finite, positive number of ms and is capped at ADMISSION_MAX_TIMEOUT_S.
+    """
+    if value is None:
+        return min(ADMISSION_DEFAULT_TIMEOUT_S, ADMISSION_MAX_TIMEOUT_S)
+    timeout_ms = float(value)
+    if not math.isfinite(timeout_ms) or timeout_ms <= 0:
+        raise ValueError("timeout must be a finite, positive number of milliseconds")
+    return min(timeout_ms / 1000, ADMISSION_MAX_TIMEOUT_S)
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    def __init__(self, max_concurrency: int = ADMISSION_MAX_CONCURRENCY,
+                 min_concurrency: int = ADMISSION_MIN_CONCURRENCY,
+                 max_queue: int = ADMISSION_MAX_QUEUE,
+                 target_llm_latency: float = ADMISSION_TARGET_LLM_LATENCY_S,
+                 backoff_factor: float = 0.7, cooldown: float = 5.0, window: int = 50):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_queue = max_queue
+        self.target_llm_latency = target_llm_latency
+        self.backoff_factor = backoff_factor
+        self.cooldown = cooldown  # min seconds between two decreases
+
+        # Event-loop state (only touched from the loop thread)
+        self.in_flight = 0
+        self._waiters = deque()
+        self._loop = None  # loop the waiters belong to, for wake-ups from worker threads
+
+        # LLM observations (reported from worker threads)
+        self._lock = threading.Lock()
+        self.limit = float(max_concurrency)
+        self._llm_calls = deque(maxlen=window)  # (latency_s, rate_limited)
+        self._llm_latency_ewma = None
+        self._request_time_ewma = None
+        self._last_decrease = 0.0
+        self.stats = {"admitted": 0, "rejected_queue_full": 0, "rejected_deadline": 0}
+
+    # ---------- Admission ----------
+    async def acquire(self, deadline: float) -> None:
+        """Wait for a pipeline slot until `deadline` (time.monotonic()), else raise AdmissionRejected."""
+        if time.monotonic() >= deadline:
+            self.stats["rejected_deadline"] += 1
+            raise AdmissionRejected("Request deadline already passed", self.retry_after())
+
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()  # timed out / cancelled while queued
+
+        if self.in_flight < self.current_limit() and not self._waiters:
+            self.in_flight += 1
+            self.stats["admitted"] += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.stats["rejected_queue_full"] += 1
+            raise AdmissionRejected("Server busy: admission queue is full", self.retry_after())
+
+        self._loop = asyncio.get_running_loop()
+        fut = self._loop.create_future()
+        self._waiters.append(fut)
+        try:
+            await asyncio.wait_for(fut, deadline - time.monotonic())
+        except asyncio.TimeoutError:
+            self._discard_waiter(fut)
+            self.stats["rejected_deadline"] += 1
+            raise AdmissionRejected("Request deadline passed while queued", self.retry_after())
+        except asyncio.CancelledError:
+            # Client went away: hand the slot on if we had already been granted one
+            if fut.done() and not fut.cancelled():
+                self.release()
+            self._discard_waiter(fut)
+            raise
+        self.stats["admitted"] += 1
+
+    def release(self, duration: float = None) -> None:
+        self.in_flight -= 1
+        if duration is not None:
+            with self._lock:
+                self._request_time_ewma = _ewma(self._request_time_ewma, duration)
+        self._grant_waiters()
+
+    def _grant_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.current_limit():
+            fut = self._waiters.popleft()
+            if fut.done():  # timed out / cancelled while queued
+                continue
+            self.in_flight += 1
+            fut.set_result(True)
+
+    def _discard_waiter(self, fut: asyncio.Future) -> None:
+        # Dead waiters must not count towards queue depth / Retry-After
+        try:
+            self._waiters.remove(fut)
+        except ValueError:
+            pass  # already popped by _grant_waiters
+
+    def is_saturated(self) -> bool:
+        """Cheap check for rejecting before the request body is read."""
+        return len(self._waiters) >= self.max_queue
+
+    def current_limit(self) -> int:
+        with self._lock:
+            return max(self.min_concurrency, int(self.limit))
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely to free up, from queue length and request time."""
+        with self._lock:
+            request_time = self._request_time_ewma or self.target_llm_latency
+        queued = len(self._waiters) + 1
+        return max(1, math.ceil(request_time * queued / self.current_limit()))
+
+    # ---------- Adaptation ----------
+    def observe_llm_call(self, latency: float, rate_limited: bool) -> None:
+        with self._lock:
+            previous_limit = int(self.limit)
+            self._llm_calls.append((latency, rate_limited))
+            self._llm_latency_ewma = _ewma(self._llm_latency_ewma, latency)
+            now = time.monotonic()
+
+            overloaded = rate_limited or self._llm_latency_ewma > self.target_llm_latency
+            if overloaded:
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(self.min_concurrency, self.limit * self.backoff_factor)
+                    self._last_decrease = now
+            else:
+                # Roughly +1 slot per `limit` healthy calls
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            grew = int(self.limit) > previous_limit
+
+        if grew:
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        # A new slot opened up: hand it to the queue now rather than on the next
+        # release(). Called from worker threads, so schedule it on the loop.
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._grant_waiters)
+        except RuntimeError:
+            pass  # loop shutting down
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = list(self._llm_calls)
+            snapshot = {
+                "limit": round(self.limit, 2),
+                "llm_latency_ewma_s": round(self._llm_latency_ewma or 0, 3),
+                "request_time_ewma_s": round(self._request_time_ewma or 0, 3),
+                "llm_429_rate": round(sum(r for _, r in calls) / len(calls), 4) if calls else 0,
+            }
+        snapshot.update({
+            "in_flight": self.in_flight,
+            "queued": sum(1 for f in self._waiters if not f.done()),
+            "max_queue": self.max_queue,
+            **self.stats
+        })
+        return snapshot
+
+
+def _ewma(previous: float, value: float, alpha: float = 0.2) -> float:
+    return value if previous is None else alpha * value + (1 - alpha) * previous
@@ -1,29 +1,97 @@
 import os
+import time
+import asyncio
+import threading
+import uuid
 import shutil
-import uvicorn
-import markdown   # <-- add this
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, UploadFile, Form, Request
 from fastapi.responses import JSONResponse, HTMLResponse
-from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 
-# Import pipeline
-from main import app as workflow_app, AgentState
+# Import pipeline (heavy modules - LangGraph, LangChain, Groq, PyPDF2, markdown,
+# Jinja - are loaded lazily; the graph itself is compiled in the startup hook)
+from main import get_app, warm_up, PIPELINE_MODES
+from state import AgentState
+from feature_store import save_features
+from scoring.rescore import rescore_candidates
+from admission import AdmissionController, AdmissionRejected, parse_timeout_ms
+from llm_client import add_llm_observer, llm_deadline, is_rate_limit_error, LLMDeadlineExceeded
 
 load_dotenv()
 
-fastapi_app = FastAPI(title="JD-Resume Matcher API")
 
-# Templates directory
-templates = Jinja2Templates(directory="templates")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start = time.perf_counter()
+    get_app()
+    print(f"Pipeline compiled in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    # Optional: run the graph once against a stubbed LLM and build the real client,
+    # so the first real request doesn't pay for lazy imports
+    if os.getenv("WARMUP_ON_STARTUP", "0") == "1":
+        print(f"Pipeline warm-up finished in {warm_up()} ms")
+        import markdown
+        get_templates()
+        if os.getenv("GROQ_API_KEY"):
+            from llm_client import get_llm
+            get_llm()
+    yield
+
+
+fastapi_app = FastAPI(title="JD-Resume Matcher API", lifespan=lifespan)
 fastapi_app.mount("/static", StaticFiles(directory="static"), name="static")
 
+_templates = None
+
+
+def get_templates():
+    global _templates
+    if _templates is None:
+        from fastapi.templating import Jinja2Templates
+        _templates = Jinja2Templates(directory="templates")  # Templates directory
+    return _templates
+
+
+# ---------- Admission Control ----------
+admission = AdmissionController()
+add_llm_observer(admission.observe_llm_call)
+
+
+def request_deadline(request: Request) -> float:
+    """Monotonic deadline from the client's X-Request-Timeout-Ms header (or the server default)."""
+    return time.monotonic() + parse_timeout_ms(request.headers.get("X-Request-Timeout-Ms"))
+
+
+def service_unavailable(reason: str, retry_after: int) -> JSONResponse:
+    return JSONResponse(status_code=503, content={"error": reason},
+                        headers={"Retry-After": str(retry_after)})
+
+
+def run_pipeline(mode: str, state: AgentState, deadline: float, cancelled: threading.Event) -> dict:
+    with llm_deadline(deadline, cancelled):
+        return get_app(mode).invoke(state)
+
+
+@fastapi_app.middleware("http")
+async def shed_load(request: Request, call_next):
+    # Shed /match before the upload is even read when the queue is already full
+    if request.url.path == "/match" and request.method == "POST" and admission.is_saturated():
+        admission.stats["rejected_queue_full"] += 1
+        return service_unavailable("Server busy: admission queue is full", admission.retry_after())
+    return await call_next(request)
+
+
+@fastapi_app.get("/metrics/admission")
+async def admission_metrics():
+    return JSONResponse(content=admission.snapshot())
+
 
 # ---------- Home Page ----------
 @fastapi_app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return get_templates().TemplateResponse("index.html", {"request": request})
 
 
 # ---------- API Endpoint ----------
@@ -31,47 +99,209 @@ async def home(request: Request):
 async def match_resume(
     request: Request,
     job_description: str = Form(...),
-    resume: UploadFile = None
+    resume: UploadFile = None,
+    mode: str = Form(None),
+    requisition_id: str = Form(None)
 ):
     if resume is None:
         return JSONResponse(status_code=400, content={"error": "Resume PDF is required"})
+    if mode is not None and mode not in PIPELINE_MODES:
+        return JSONResponse(status_code=400, content={"error": f"mode must be one of {list(PIPELINE_MODES)}"})
+
+    store = None
+    if requisition_id is not None:
+        from candidate_store import get_store  # numpy is only needed once a requisition is used
+        try:
+            store = get_store(requisition_id, create=True)
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"error": str(e)})
     
-    # Save uploaded resume temporarily
-    temp_resume_path = f"temp_{resume.filename}"
-    with open(temp_resume_path, "wb") as buffer:
-        shutil.copyfileobj(resume.file, buffer)
-
-    # Initialize state
-    state: AgentState = {
-        "job_description": job_description,
-        "resume_file": temp_resume_path,
-        "jd_summary": {},
-        "resume_text": "",
-        "resume_summary": {},
-        "attribute_scores": {},
-        "similarity_score": 0,
-        "rating": "",
-        "comments": ""
-    }
-
-    # Run pipeline
-    result = workflow_app.invoke(state)
+    # Admission control: wait for a pipeline slot until the request's deadline
+    try:
+        deadline = request_deadline(request)
+    except ValueError:
+        return JSONResponse(status_code=400,
+                            content={"error": "X-Request-Timeout-Ms must be a finite, positive number"})
+    try:
+        await admission.acquire(deadline)
+    except AdmissionRejected as e:
+        return service_unavailable(e.reason, e.retry_after)
+
+    start = time.monotonic()
+    # Save uploaded resume temporarily (unique name: requests run concurrently)
+    temp_resume_path = f"temp_{uuid.uuid4().hex}_{os.path.basename(resume.filename or 'resume.pdf')}"
+    cancelled = threading.Event()
+
+    def finish(pipeline=None):
+        # Runs when the worker thread is done, not when the client goes away: a
+        # thread can't be stopped, so it keeps its slot (and the temp file) until then
+        if pipeline is not None and not pipeline.cancelled():
+            pipeline.exception()  # mark retrieved, nobody awaits it after a disconnect
+        admission.release(time.monotonic() - start)
+        # Cleanup
+        try:
+            os.remove(temp_resume_path)
+        except:
+            pass
+
+    try:
+        with open(temp_resume_path, "wb") as buffer:
+            shutil.copyfileobj(resume.file, buffer)
+
+        # Initialize state
+        state: AgentState = {
+            "job_description": job_description,
+            "requisition_id": requisition_id or "",
+            "resume_file": temp_resume_path,
+            "jd_summary": {},
+            "resume_text": "",
+            "resume_summary": {},
+            "attribute_scores": {},
+            "similarity_score": 0,
+            "rating": "",
+            "comments": ""
+        }
+
+        # Run pipeline in a worker thread so the event loop keeps admitting / shedding
+        pipeline = asyncio.get_running_loop().run_in_executor(None, run_pipeline, mode, state, deadline, cancelled)
+    except BaseException:
+        finish()
+        raise
+    pipeline.add_done_callback(finish)
+
+    try:
+        result = await asyncio.shield(pipeline)
+    except asyncio.CancelledError:
+        # Client disconnected / shutdown: the thread stops before its next LLM call
+        cancelled.set()
+        raise
+    except LLMDeadlineExceeded:
+        return service_unavailable("Request deadline passed during processing", admission.retry_after())
+    except Exception as e:
+        if is_rate_limit_error(e):
+            return service_unavailable("LLM rate limit reached", admission.retry_after())
+        raise
+
+    # Keep extracted features so the candidate can be re-scored without the LLM
+    # (knocked-out candidates never got LLM features)
+    candidate_id = uuid.uuid4().hex
+    if not result.get("knocked_out"):
+        save_features(candidate_id, result)
+    result["candidate_id"] = candidate_id
+
+    # Add to the requisition's ranking store (compact features only, no resume text)
+    if store is not None:
+        store.add(result, candidate_id)
+        result["requisition_id"] = requisition_id
 
     # Convert markdown in comments to HTML
     if result.get("comments"):
+        import markdown
         result["comments_html"] = markdown.markdown(result["comments"])
     else:
         result["comments_html"] = ""
 
-    # Cleanup
+    # Render results on frontend
+    return JSONResponse(content=result)
+    return get_templates().TemplateResponse("result.html", {"request": request, "result": result})
+
+# ---------- Re-scoring Endpoint ----------
+@fastapi_app.post("/rescore")
+async def rescore(request: Request):
+    """
+    Recompute scores for stored candidates from their saved features (no LLM calls).
+    Body (all optional): {"config": {weights, rating_buckets, fuzzy_threshold, ...},
+                          "candidate_ids": [...]}
+    """
+    try:
+        body = await request.json() if await request.body() else {}
+    except ValueError:
+        return JSONResponse(status_code=400, content={"error": "Request body must be valid JSON"})
+    if not isinstance(body, dict):
+        return JSONResponse(status_code=400, content={"error": "Request body must be a JSON object"})
+    if body.get("candidate_ids") is not None and not isinstance(body["candidate_ids"], list):
+        return JSONResponse(status_code=400, content={"error": "candidate_ids must be a list"})
     try:
-        os.remove(temp_resume_path)
-    except:
-        pass
+        # SQLite reads + scoring are blocking: keep them off the event loop (admission / shedding)
+        result = await asyncio.to_thread(rescore_candidates, body.get("config"), body.get("candidate_ids"))
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": f"Invalid scoring config: {e}"})
+    return JSONResponse(content=result)
 
-    # Render results on frontend
+# ---------- Requisition Ranking Endpoints ----------
+@fastapi_app.get("/requisitions/{requisition_id}/candidates")
+async def list_candidates(request: Request, requisition_id: str, k: int = 10, offset: int = 0,
+                          sort_by: str = "similarity_score", rating: str = None):
+    """
+    Paginated top-K candidates of a requisition.
+    Filters: min_<column>=<value>, e.g. ?min_skills_match=70&min_experience_months=24
+    """
+    from candidate_store import get_store, MAX_PAGE_SIZE
+    if k < 1 or offset < 0:
+        return JSONResponse(status_code=400, content={"error": "k must be >= 1 and offset >= 0"})
+    k = min(k, MAX_PAGE_SIZE)
+    try:
+        store = get_store(requisition_id)
+        if store is None:
+            return JSONResponse(status_code=404, content={"error": "No candidates for this requisition"})
+        min_scores = {key[len("min_"):]: float(value)
+                      for key, value in request.query_params.items() if key.startswith("min_")}
+        result = store.top_k(k=k, offset=offset, min_scores=min_scores, rating=rating, sort_by=sort_by)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
     return JSONResponse(content=result)
-    return templates.TemplateResponse("result.html", {"request": request, "result": result})
+
+
+@fastapi_app.get("/requisitions/{requisition_id}/export")
+async def export_candidates(requisition_id: str, format: str = "csv"):
+    from starlette.background import BackgroundTask
+    from fastapi.responses import FileResponse
+    from candidate_store import get_store
+
+    if format not in ("csv", "parquet"):
+        return JSONResponse(status_code=400, content={"error": "format must be csv or parquet"})
+    try:
+        store = get_store(requisition_id)
+        if store is None:
+            return JSONResponse(status_code=404, content={"error": "No candidates for this requisition"})
+        file_path = store.export(f"temp_{requisition_id}_{uuid.uuid4().hex}.{format}", format)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+    except RuntimeError as e:  # pyarrow not installed: a server limitation, not a client error
+        return JSONResponse(status_code=501, content={"error": str(e)})
+    return FileResponse(file_path, filename=f"{requisition_id}.{format}",
+                        background=BackgroundTask(os.remove, file_path))
+
+# ---------- Knock-out Rules ----------
+@fastapi_app.put("/requisitions/{requisition_id}/knockout")
+async def set_knockout_rules(request: Request, requisition_id: str):
+    """
+    Body: {"requirements": {"Notice Period": "30 days", "Location": "Bangalore"},
+           "min_scores": {"Notice Period Match": 100, "Location Match": 100}}
+    """
+    from scoring.knockout import save_knockout_rules
+    try:
+        rules = save_knockout_rules(requisition_id, await request.json())
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+    return JSONResponse(content=rules)
+
+
+@fastapi_app.get("/requisitions/{requisition_id}/knockout")
+async def get_knockout_rules(requisition_id: str):
+    from scoring.knockout import load_knockout_rules
+    rules = load_knockout_rules(requisition_id)
+    if rules is None:
+        return JSONResponse(status_code=404, content={"error": "No knock-out rules for this requisition"})
+    return JSONResponse(content=rules)
+
+
+@fastapi_app.get("/metrics/knockout")
+async def knockout_metrics():
+    """Candidates screened / knocked out and the LLM calls that saved."""
+    from scoring.knockout import get_knockout_metrics
+    return JSONResponse(content=get_knockout_metrics())
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run("app:fastapi_app", host="0.0.0.0", port=8000, reload=True)
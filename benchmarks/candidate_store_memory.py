@@ -0,0 +1,95 @@
+"""
+Memory / latency benchmark for the columnar candidate store.
+
+Fills a throwaway requisition with N synthetic candidates (default 100k) and reports
+bytes per candidate on disk, Python heap per candidate while querying, and top-K /
+filtered top-K latency.
+
+Usage:
+    python benchmarks/candidate_store_memory.py [--candidates 100000]
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from candidate_store import CandidateStore
+
+SKILLS = ["Python", "SQL", "AWS", "Docker", "Kubernetes", "PyTorch", "TensorFlow", "Spark",
+          "Airflow", "FastAPI", "React", "Java", "Go", "Terraform", "LangChain", "Pandas"]
+RATINGS = ["Strong Match", "Moderate Match", "Weak Match"]
+
+
+def synthetic_candidate(rnd: random.Random) -> dict:
+    jd_skills = rnd.sample(SKILLS, 8)
+    matched = rnd.sample(jd_skills, rnd.randint(0, 8))
+    months = rnd.randint(0, 180)
+    return {
+        "attribute_scores": {
+            "Skills Match": round(len(matched) / 8 * 100, 2),
+            "Experience Match": rnd.choice([0, 50, 100]),
+            "Location Match": rnd.choice([0, 50, 100]),
+            "Notice Period Match": rnd.choice([0, 100]),
+            "Other Requirements Match": rnd.choice([0, 40, 65, 100])
+        },
+        "similarity_score": round(rnd.uniform(0, 100), 2),
+        "rating": rnd.choice(RATINGS),
+        "matched_skills": matched,
+        "missing_skills": [s for s in jd_skills if s not in matched],
+        "resume_summary": {"Years of Experience": f"{months // 12} years {months % 12} months"}
+    }
+
+
+def timed(fn, repeats: int = 20) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Candidate store memory benchmark")
+    parser.add_argument("--candidates", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.candidates
+
+    rnd = random.Random(0)
+    path = tempfile.mkdtemp(prefix="candidate_store_bench_")
+    try:
+        store = CandidateStore(path)
+        start = time.perf_counter()
+        batch = 10_000
+        for i in range(0, n, batch):
+            store.add_many([(synthetic_candidate(rnd), f"{j:032x}") for j in range(i, min(i + batch, n))])
+        load_s = time.perf_counter() - start
+
+        # Query from a freshly opened store, as a new worker would
+        tracemalloc.start()
+        store = CandidateStore(path)
+        top_ms = timed(lambda: store.top_k(k=20))
+        filtered_ms = timed(lambda: store.top_k(k=20, offset=100, min_scores={"skills_match": 70}))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print("\n===== Candidate Store @ {:,} candidates =====".format(n))
+        print(f"Ingest                     : {load_s:.2f} s")
+        print(f"On disk                    : {store.nbytes() / 1e6:.2f} MB ({store.nbytes() / n:.1f} bytes/candidate)")
+        print(f"Peak Python heap (queries) : {peak / 1e6:.2f} MB ({peak / n:.1f} bytes/candidate)")
+        print(f"Top-20                     : {top_ms:.2f} ms")
+        print(f"Top-20, page 6, Skills≥70  : {filtered_ms:.2f} ms")
+        print("=============================================")
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Quality-parity report: single-call "combined" pipeline mode vs the "multi" mode.
+
+Runs every resume through both modes against the same job description (real LLM,
+GROQ_API_KEY required) and reports how far the combined mode drifts from the
+multi-call mode, next to what it saves in LLM calls and latency.
+
+Usage:
+    python benchmarks/combined_parity.py --jd jd.txt --resumes resumes/ [--json report.json]
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_client import get_llm, override_llm
+from main import get_app, PIPELINE_MODES
+
+
+class CountingLLM:
+    """Wraps the real LLM and counts round trips."""
+
+    def __init__(self, llm):
+        self.llm = llm
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return self.llm.invoke(messages)
+
+
+def run_pipeline(mode: str, jd_text: str, resume_path: str) -> dict:
+    state = {
+        "job_description": jd_text,
+        "resume_file": resume_path,
+        "jd_summary": {},
+        "resume_text": "",
+        "resume_summary": {},
+        "attribute_scores": {},
+        "similarity_score": 0,
+        "rating": "",
+        "comments": ""
+    }
+    counter = CountingLLM(get_llm())
+    start = time.perf_counter()
+    with override_llm(counter):
+        result = get_app(mode).invoke(state)
+    result["latency_ms"] = (time.perf_counter() - start) * 1000
+    result["llm_calls"] = counter.calls
+    return result
+
+
+def jaccard(a: list, b: list) -> float:
+    a, b = {s.lower() for s in a}, {s.lower() for s in b}
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Combined vs multi-call pipeline parity report")
+    parser.add_argument("--jd", required=True, help="Text file with the job description")
+    parser.add_argument("--resumes", required=True, help="Directory of resume PDFs")
+    parser.add_argument("--json", help="Also write the per-resume rows to this file")
+    args = parser.parse_args()
+
+    with open(args.jd, "r") as f:
+        jd_text = f.read()
+    resumes = sorted(glob.glob(os.path.join(args.resumes, "*.pdf")))
+    if not resumes:
+        sys.exit(f"No PDFs found in {args.resumes}")
+
+    rows = []
+    for path in resumes:
+        results = {mode: run_pipeline(mode, jd_text, path) for mode in PIPELINE_MODES}
+        multi, combined = results["multi"], results["combined"]
+        rows.append({
+            "resume": os.path.basename(path),
+            "similarity": {m: r["similarity_score"] for m, r in results.items()},
+            "rating": {m: r["rating"] for m, r in results.items()},
+            "attribute_scores": {m: r["attribute_scores"] for m, r in results.items()},
+            "skills_jaccard": jaccard(multi.get("matched_skills", []), combined.get("matched_skills", [])),
+            "llm_calls": {m: r["llm_calls"] for m, r in results.items()},
+            "latency_ms": {m: round(r["latency_ms"], 1) for m, r in results.items()}
+        })
+        print(f"{os.path.basename(path)}: multi {multi['similarity_score']} ({multi['rating']}) | "
+              f"combined {combined['similarity_score']} ({combined['rating']})")
+
+    def mean(values):
+        return statistics.mean(values) if values else 0
+
+    attributes = rows[0]["attribute_scores"]["multi"].keys()
+    report = "\n===== Combined vs Multi-call Parity =====\n"
+    report += f"Resumes                    : {len(rows)}\n"
+    report += f"Rating agreement           : {mean([r['rating']['multi'] == r['rating']['combined'] for r in rows]) * 100:.1f}%\n"
+    report += f"Mean |Δ similarity score|  : {mean([abs(r['similarity']['multi'] - r['similarity']['combined']) for r in rows]):.2f}\n"
+    for attr in attributes:
+        diff = mean([abs(r['attribute_scores']['multi'].get(attr, 0) - r['attribute_scores']['combined'].get(attr, 0)) for r in rows])
+        report += f"  Mean |Δ {attr:<25}|: {diff:.2f}\n"
+    report += f"Matched skills Jaccard     : {mean([r['skills_jaccard'] for r in rows]):.2f}\n"
+    report += "-----------------------------------------\n"
+    for mode in PIPELINE_MODES:
+        report += (f"{mode:<9}: {mean([r['llm_calls'][mode] for r in rows]):.1f} LLM calls, "
+                   f"{mean([r['latency_ms'][mode] for r in rows]):.0f} ms mean latency\n")
+    report += "=========================================\n"
+    print(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Cold-start benchmark for serverless deployment.
+
+Measures, each in a fresh interpreter:
+  1. `python -X importtime -c "import app"` - total import time plus the slowest modules
+  2. time-to-first-response - import app, compile the graph and answer one /match
+     style pipeline run against a stubbed LLM (no network)
+
+Fails (exit code 1) if either number exceeds its budget, so it can gate CI.
+
+Usage:
+    python benchmarks/startup_bench.py [--import-budget-ms 400] [--first-response-budget-ms 3000] [--top 15]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Regression budgets (ms). Tighten these when cold start improves.
+IMPORT_BUDGET_MS = 400
+FIRST_RESPONSE_BUDGET_MS = 3000
+
+FIRST_RESPONSE_SNIPPET = """
+import time
+start = time.perf_counter()
+import app
+from main import warm_up
+warm_up()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def import_breakdown(top: int):
+    """Return (total_ms, [(cumulative_ms, module), ...]) from -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        sys.exit(f"Importing app failed:\n{proc.stderr}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1000, module.rstrip()))
+
+    # Top-level imports (no indentation) add up to the total import time
+    total = sum(ms for ms, module in rows if not module.startswith("  "))
+    slowest = sorted(rows, reverse=True)[:top]
+    return total, slowest
+
+
+def time_to_first_response() -> float:
+    proc = subprocess.run(
+        [sys.executable, "-c", FIRST_RESPONSE_SNIPPET],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        sys.exit(f"First response run failed:\n{proc.stderr}")
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start benchmark")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--first-response-budget-ms", type=float, default=FIRST_RESPONSE_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    total_import, slowest = import_breakdown(args.top)
+    print("===== import app (-X importtime) =====")
+    for ms, module in slowest:
+        print(f"{ms:>10.1f} ms  {module}")
+    print("--------------------------------------")
+    print(f"{total_import:>10.1f} ms  total (budget {args.import_budget_ms:.0f} ms)")
+
+    first_response = time_to_first_response()
+    print("\n===== time to first response (stub LLM) =====")
+    print(f"{first_response:>10.1f} ms  (budget {args.first_response_budget_ms:.0f} ms)")
+
+    failed = []
+    if total_import > args.import_budget_ms:
+        failed.append(f"import time {total_import:.1f} ms > {args.import_budget_ms:.0f} ms")
+    if first_response > args.first_response_budget_ms:
+        failed.append(f"time to first response {first_response:.1f} ms > {args.first_response_budget_ms:.0f} ms")
+
+    if failed:
+        print("\nStartup budget exceeded: " + "; ".join(failed))
+        sys.exit(1)
+    print("\nStartup within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+import os
+import re
+import json
+import fcntl
+import threading
+import time
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+# Server-side, per-requisition candidate store for ranking large applicant pools.
+#
+# Each requisition is a directory of fixed-width column files (one per feature),
+# appended to on write and memory-mapped on read, so ranking 100k candidates
+# never loads raw resume text or per-candidate JSON. Matched / missing skills are
+# stored as interned ids in CSR layout (flat id column + per-candidate offsets).
+#
+# Several workers / processes may share a requisition: appends and meta writes
+# hold an exclusive flock on the requisition's lock file, and every reader or
+# writer reloads meta.json when another process has changed it. The directory must
+# be on a filesystem with working flock (local disk, not most network mounts).
+CANDIDATE_STORE_DIR = os.getenv("CANDIDATE_STORE_DIR", "candidate_store")
+# Largest page /requisitions/{id}/candidates will return
+MAX_PAGE_SIZE = int(os.getenv("CANDIDATE_STORE_MAX_PAGE_SIZE", "500"))
+
+ATTRIBUTE_COLUMNS = {
+    "Skills Match": "skills_match",
+    "Experience Match": "experience_match",
+    "Location Match": "location_match",
+    "Notice Period Match": "notice_period_match",
+    "Other Requirements Match": "other_requirements_match"
+}
+
+# Fixed-width columns: name -> dtype
+COLUMNS = {
+    "candidate_id": "S32",
+    "created_at": "<f8",
+    **{col: "<f4" for col in ATTRIBUTE_COLUMNS.values()},
+    "similarity_score": "<f4",
+    "experience_months": "<i4",
+    "rating": "u1",
+    "matched_offsets": "<i8",  # end offset of each candidate's ids in matched_ids
+    "missing_offsets": "<i8",
+}
+# Variable-length columns (interned skill ids)
+ID_COLUMNS = {"matched_ids": "<u4", "missing_ids": "<u4"}
+
+NUMERIC_COLUMNS = [*ATTRIBUTE_COLUMNS.values(), "similarity_score", "experience_months"]
+
+
+def parse_experience_months(exp_str: str) -> int:
+    """'2 years 3 months' -> 27 (format produced by resume_extractor.experience_string)."""
+    years = re.search(r"(\d+)\s*year", exp_str or "")
+    months = re.search(r"(\d+)\s*month", exp_str or "")
+    return (int(years.group(1)) * 12 if years else 0) + (int(months.group(1)) if months else 0)
+
+
+class CandidateStore:
+    """Columnar, memory-mapped candidate features for one requisition."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._maps = {}
+        self._meta_version = None
+        os.makedirs(path, exist_ok=True)
+        self._refresh()
+
+    # ---------- Writes ----------
+    def add(self, state: Dict[str, Any], candidate_id: str) -> None:
+        """Append a scored pipeline result. Raw resume / JD text is not stored."""
+        self.add_many([(state, candidate_id)])
+
+    def add_many(self, items: List[tuple]) -> None:
+        """Append [(state, candidate_id), ...] with one write per column."""
+        with self._lock, self._file_lock():
+            self._refresh()
+            # Drop any half-written rows past the last committed count (crashed writer)
+            for name, dtype in COLUMNS.items():
+                self._truncate(name, dtype, self.count)
+            for name, dtype in ID_COLUMNS.items():
+                self._truncate(name, dtype, self._id_counts[name])
+
+            rows = {name: [] for name in COLUMNS}
+            ids = {"matched_ids": [], "missing_ids": []}
+            matched_end = self._id_counts["matched_ids"]
+            missing_end = self._id_counts["missing_ids"]
+
+            for state, candidate_id in items:
+                matched = [self._intern_skill(s) for s in state.get("matched_skills", [])]
+                missing = [self._intern_skill(s) for s in state.get("missing_skills", [])]
+                matched_end += len(matched)
+                missing_end += len(missing)
+                ids["matched_ids"] += matched
+                ids["missing_ids"] += missing
+
+                rating = state.get("rating", "")
+                if rating not in self.ratings:
+                    self.ratings.append(rating)
+
+                scores = state.get("attribute_scores", {})
+                rows["candidate_id"].append(candidate_id.encode()[:32])
+                rows["created_at"].append(time.time())
+                for attr, col in ATTRIBUTE_COLUMNS.items():
+                    # Knocked-out candidates are only scored on the rules they failed:
+                    # the rest is unknown (NaN), not a real 0
+                    rows[col].append(scores.get(attr, np.nan))
+                rows["similarity_score"].append(state.get("similarity_score", 0))
+                rows["experience_months"].append(parse_experience_months(
+                    state.get("resume_summary", {}).get("Years of Experience", "")))
+                rows["rating"].append(self.ratings.index(rating))
+                rows["matched_offsets"].append(matched_end)
+                rows["missing_offsets"].append(missing_end)
+
+            # Columns first, then meta: a crash in between leaves rows past
+            # meta["count"], which are truncated by the next writer
+            for name, dtype in COLUMNS.items():
+                self._append(name, np.array(rows[name], dtype=dtype))
+            for name, dtype in ID_COLUMNS.items():
+                self._append(name, np.array(ids[name], dtype=dtype))
+
+            self.count += len(items)
+            self._id_counts["matched_ids"] = matched_end
+            self._id_counts["missing_ids"] = missing_end
+            self._maps.clear()
+            self._write_meta()
+
+    # ---------- Reads ----------
+    def top_k(self, k: int = 10, offset: int = 0, min_scores: Optional[Dict[str, float]] = None,
+              rating: Optional[str] = None, sort_by: str = "similarity_score") -> Dict[str, Any]:
+        """
+        Page through candidates ordered by `sort_by` (descending).
+        min_scores: {column: minimum}, e.g. {"skills_match": 70}.
+        """
+        if sort_by not in NUMERIC_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort_by}; expected one of {NUMERIC_COLUMNS}")
+
+        if k < 1 or offset < 0:
+            raise ValueError("k must be >= 1 and offset >= 0")
+
+        with self._lock:
+            self._refresh()
+            if self.count == 0:
+                return {"total": 0, "offset": offset, "k": k, "candidates": []}
+
+            mask = np.ones(self.count, dtype=bool)
+            for column, minimum in (min_scores or {}).items():
+                if column not in NUMERIC_COLUMNS:
+                    raise ValueError(f"Cannot filter on {column}; expected one of {NUMERIC_COLUMNS}")
+                mask &= self._column(column) >= minimum
+            if rating is not None:
+                if rating not in self.ratings:
+                    mask[:] = False
+                else:
+                    mask &= self._column("rating") == self.ratings.index(rating)
+
+            idx = np.flatnonzero(mask)
+            values = self._column(sort_by)[idx]
+            if values.dtype.kind == "f":
+                values = np.where(np.isnan(values), -np.inf, values)  # unscored rows rank last
+            end = min(offset + k, len(idx))
+            if end <= offset:
+                page = idx[:0]
+            else:
+                # Only sort rows that can land on the requested page: everything at or
+                # above the end-th largest value. Ties keep insertion order, so pages
+                # stay consistent with each other.
+                threshold = np.partition(values, len(values) - end)[len(values) - end]
+                head = np.flatnonzero(values >= threshold)
+                head = head[np.argsort(-values[head], kind="stable")]
+                page = idx[head[offset:end]]
+
+            return {
+                "total": int(len(idx)),
+                "offset": offset,
+                "k": k,
+                "candidates": [self._row(i) for i in page]
+            }
+
+    def export(self, file_path: str, fmt: str = "csv") -> str:
+        """Export every candidate of this requisition as CSV or Parquet."""
+        with self._lock:
+            self._refresh()
+            rows = [self._row(i) for i in range(self.count)]
+
+        if fmt == "parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+            pq.write_table(pa.Table.from_pylist(rows), file_path)
+        elif fmt == "csv":
+            import csv
+            with open(file_path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ["candidate_id"])
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow({**row,
+                                     "matched_skills": "; ".join(row["matched_skills"]),
+                                     "missing_skills": "; ".join(row["missing_skills"])})
+        else:
+            raise ValueError(f"Unknown export format: {fmt} (expected csv or parquet)")
+        return file_path
+
+    def nbytes(self) -> int:
+        """On-disk size of all columns."""
+        names = list(COLUMNS) + list(ID_COLUMNS)
+        return sum(os.path.getsize(self._file(n)) for n in names if os.path.exists(self._file(n)))
+
+    # ---------- Internals ----------
+    def _file_lock(self):
+        return _FileLock(os.path.join(self.path, "store.lock"))
+
+    def _refresh(self) -> None:
+        """(Re)load meta.json if it changed since we last read it, e.g. written by another process."""
+        meta_path = os.path.join(self.path, "meta.json")
+        try:
+            st = os.stat(meta_path)
+            version = st.st_mtime_ns, st.st_ino, st.st_size
+        except FileNotFoundError:
+            version = None
+        if version == self._meta_version and version is not None:
+            return
+
+        if version is not None:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+        else:
+            meta = {"count": 0, "matched_count": 0, "missing_count": 0, "skills": [], "ratings": []}
+        self.count = meta["count"]
+        self._id_counts = {"matched_ids": meta["matched_count"], "missing_ids": meta["missing_count"]}
+        self.skills = meta["skills"]
+        self.ratings = meta["ratings"]
+        self._skill_ids = {s.lower(): i for i, s in enumerate(self.skills)}
+        self._meta_version = version
+        self._maps.clear()
+
+    def _row(self, i: int) -> Dict[str, Any]:
+        row = {
+            "candidate_id": self._column("candidate_id")[i].decode(),
+            **{col: _score(self._column(col)[i]) for col in ATTRIBUTE_COLUMNS.values()},
+            "similarity_score": round(float(self._column("similarity_score")[i]), 2),
+            "experience_months": int(self._column("experience_months")[i]),
+            "rating": self.ratings[self._column("rating")[i]],
+        }
+        for kind in ("matched", "missing"):
+            offsets = self._column(f"{kind}_offsets")
+            start = int(offsets[i - 1]) if i > 0 else 0
+            ids = self._column(f"{kind}_ids")[start:int(offsets[i])]
+            row[f"{kind}_skills"] = [self.skills[j] for j in ids]
+        return row
+
+    def _column(self, name: str) -> np.ndarray:
+        if name not in self._maps:
+            dtype = COLUMNS.get(name) or ID_COLUMNS[name]
+            length = self._id_counts[name] if name in ID_COLUMNS else self.count
+            if length == 0:
+                self._maps[name] = np.empty(0, dtype=dtype)
+            else:
+                self._maps[name] = np.memmap(self._file(name), dtype=dtype, mode="r", shape=(length,))
+        return self._maps[name]
+
+    def _intern_skill(self, skill: str) -> int:
+        key = skill.strip().lower()
+        if key not in self._skill_ids:
+            self._skill_ids[key] = len(self.skills)
+            self.skills.append(skill.strip())
+        return self._skill_ids[key]
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.col")
+
+    def _append(self, name: str, values: np.ndarray) -> None:
+        with open(self._file(name), "ab") as f:
+            f.write(values.tobytes())
+
+    def _truncate(self, name: str, dtype: str, length: int) -> None:
+        path = self._file(name)
+        size = length * np.dtype(dtype).itemsize
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, "r+b") as f:
+                f.truncate(size)
+
+    def _write_meta(self) -> None:
+        meta = {
+            "count": self.count,
+            "matched_count": self._id_counts["matched_ids"],
+            "missing_count": self._id_counts["missing_ids"],
+            "skills": self.skills,
+            "ratings": self.ratings
+        }
+        tmp_path = os.path.join(self.path, "meta.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, os.path.join(self.path, "meta.json"))
+        st = os.stat(os.path.join(self.path, "meta.json"))
+        self._meta_version = st.st_mtime_ns, st.st_ino, st.st_size
+
+
+def _score(value) -> Optional[float]:
+    """Attribute score for output; None (JSON null / empty CSV cell) if it was never computed."""
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+class _FileLock:
+    """Exclusive flock, held across processes for the duration of a `with` block."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+_stores: Dict[str, CandidateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(requisition_id: str, create: bool = False) -> Optional[CandidateStore]:
+    """
+    Store of a requisition, or None if it has no candidates yet. Only /match passes
+    create=True, so read-only endpoints never create directories or cache entries.
+    """
+    if not re.fullmatch(r"[A-Za-z0-9_\-]{1,64}", requisition_id or ""):
+        raise ValueError("requisition_id must be 1-64 characters of letters, digits, '-' or '_'")
+    with _stores_lock:
+        if requisition_id not in _stores:
+            path = os.path.join(CANDIDATE_STORE_DIR, requisition_id)
+            if not create and not os.path.isdir(path):
+                return None
+            _stores[requisition_id] = CandidateStore(path)
+        return _stores[requisition_id]
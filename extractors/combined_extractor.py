@@ -0,0 +1,118 @@
+import re
+import json
+from langchain_core.messages import HumanMessage
+from llm_client import get_llm
+from extractors.jd_extractor import validate_jd_attributes, empty_jd_attributes
+from extractors.resume_extractor import experience_string, validate_resume_attributes, empty_resume_attributes
+from extractors.skills_matcher import validate_matched_skills
+from scoring.attributes import split_skills
+from typing import Dict, Any
+
+
+def extract_and_match(jd_text: str, resume_text: str) -> Dict[str, Any]:
+    """
+    Single-call alternative to extract_jd_attributes + extract_resume_attributes +
+    llm_find_common_skills: one prompt returns both summaries and the skill match.
+    The answer is validated against the same schemas as the multi-call extractors.
+
+    Returns {"jd_summary", "resume_summary", "matched_skills", "missing_skills"}.
+    """
+
+    # Work experience is still computed locally, not by the LLM
+    exp_str = experience_string(resume_text)
+
+    prompt = f"""
+    You are an intelligent job description parser, resume parser and expert recruiter.
+    Read the Job Description and the Resume below and fill in the JSON schema given below.
+
+    "JD" (from the Job Description only):
+    - Key Skills: comma-separated string of ONLY technical skills (programming languages, frameworks, libraries, ML/DL algorithms, cloud tools, APIs, software platforms).
+    ❌ Do NOT include company names, soft skills, domains, business terms, responsibilities, or generic words like "cloud", "solutions", "predictive models".
+    - Years of Experience, Notice Period, Location: extract if explicitly mentioned, else "".
+    - Other Requirements: certifications, domain knowledge, or industry-specific needs.
+
+    "Resume" (from the Resume only):
+    - Key Skills: comma-separated string.
+    - Notice Period, Location: if not found, leave empty.
+    - Degrees: list with objects {{'degree', 'institute', 'duration', 'CGPA/grade'}}.
+    - Courses: list with objects {{'course', 'provider'}}.
+    - Interpersonal Skills: list of soft skills (leadership, teamwork, communication, confidence, etc.).
+    - Awards: list of awards, honors, recognitions.
+
+    "Matched Skills": the JD Key Skills that are represented in the Resume Key Skills, i.e. the resume skill is
+    the exact same skill, an acronym or full form (e.g., 'LLM' ↔ 'Large Language Model'), a synonym,
+    equivalent term or related technology, or a broader category or a sub-skill.
+    ❌ Do not match unrelated skills (e.g., 'Java' ≠ 'JavaScript').
+    ✅ Only list JD skills, spelled exactly as in "JD" → "Key Skills". No resume skills.
+
+    "Missing Skills": the JD Key Skills that are not in "Matched Skills".
+
+    Rules:
+    - If something is not explicitly mentioned, return [] for lists or "" for strings.
+    - Do NOT change field names.
+    - Do NOT omit any field.
+    - Always return valid JSON in exactly this schema.
+
+    {{
+      "JD": {{
+        "Key Skills": "",
+        "Years of Experience": "",
+        "Notice Period": "",
+        "Location": "",
+        "Other Requirements": ""
+      }},
+      "Resume": {{
+        "Key Skills": "",
+        "Notice Period": "",
+        "Location": "",
+        "Degrees": [],
+        "Courses": [],
+        "Interpersonal Skills": [],
+        "Awards": []
+      }},
+      "Matched Skills": [],
+      "Missing Skills": []
+    }}
+
+    Job Description:
+    {jd_text}
+
+    Resume Text:
+    {resume_text}
+    """
+
+    resp = get_llm().invoke([HumanMessage(content=prompt)]).content.strip()
+
+    jd_summary = empty_jd_attributes()
+    resume_summary = empty_resume_attributes(exp_str)
+    matched_skills = []
+
+    # Validate each part against the multi-call schemas
+    match = re.search(r"\{.*\}", resp, re.DOTALL)
+    if match:
+        try:
+            parsed = json.loads(match.group())
+            jd_summary = validate_jd_attributes(parsed.get("JD", {}))
+            resume_summary = validate_resume_attributes(parsed.get("Resume", {}), exp_str)
+            if isinstance(parsed.get("Matched Skills"), list):
+                matched_skills = parsed["Matched Skills"]
+        except:
+            pass
+
+    jd_skills = split_skills(jd_summary.get("Key Skills", ""))
+    resume_skills = split_skills(resume_summary.get("Key Skills", ""))
+    if jd_skills and resume_skills:
+        matched_skills = validate_matched_skills(matched_skills, jd_skills)
+    else:
+        matched_skills = []
+
+    # Missing skills are derived the same way as in multi-call mode so both modes
+    # stay consistent even if the LLM's own "Missing Skills" list disagrees
+    missing_skills = list(set(jd_skills) - set(matched_skills))
+
+    return {
+        "jd_summary": jd_summary,
+        "resume_summary": resume_summary,
+        "matched_skills": matched_skills,
+        "missing_skills": missing_skills
+    }
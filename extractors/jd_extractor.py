@@ -1,8 +1,8 @@
 import re, json
 from langchain_core.messages import HumanMessage
-from llm_client import llm
+from llm_client import get_llm
 from helpers.normalizers import normalize_experience, normalize_skills, normalize_text_field
-from typing import Dict
+from typing import Dict, Any
 
 def extract_jd_attributes(text: str) -> Dict[str, str]:
     """Extract structured attributes from a job description with fixed schema."""
@@ -36,31 +36,36 @@ def extract_jd_attributes(text: str) -> Dict[str, str]:
     {text}
     """
 
-    resp = llm.invoke([HumanMessage(content=prompt)]).content.strip()
+    resp = get_llm().invoke([HumanMessage(content=prompt)]).content.strip()
 
     # Validate and force schema
     match = re.search(r"\{.*\}", resp, re.DOTALL)
     if match:
         try:
-            parsed = json.loads(match.group())
-
-            # Normalize fields for consistency
-            fixed_result = {
-                "Key Skills": normalize_skills(parsed.get("Key Skills", "")),
-                "Years of Experience": normalize_experience(parsed.get("Years of Experience", "")),
-                "Notice Period": normalize_text_field(parsed.get("Notice Period", "")),
-                "Location": normalize_text_field(parsed.get("Location", "")),
-                "Other Requirements": normalize_text_field(parsed.get("Other Requirements", ""))
-            }
-            return fixed_result
+            return validate_jd_attributes(json.loads(match.group()))
         except:
             pass
 
     # Fallback (safe empty schema)
+    return empty_jd_attributes()
+
+
+def validate_jd_attributes(parsed: Dict[str, Any]) -> Dict[str, str]:
+    """Force a parsed LLM answer into the JD schema, normalizing fields for consistency."""
+    return {
+        "Key Skills": normalize_skills(parsed.get("Key Skills", "")),
+        "Years of Experience": normalize_experience(parsed.get("Years of Experience", "")),
+        "Notice Period": normalize_text_field(parsed.get("Notice Period", "")),
+        "Location": normalize_text_field(parsed.get("Location", "")),
+        "Other Requirements": normalize_text_field(parsed.get("Other Requirements", ""))
+    }
+
+
+def empty_jd_attributes() -> Dict[str, str]:
     return {
         "Key Skills": "",
         "Years of Experience": "",
         "Notice Period": "",
         "Location": "",
         "Other Requirements": ""
-    }
\ No newline at end of file
+    }
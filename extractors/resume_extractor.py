@@ -1,7 +1,7 @@
 import re
 import json
 from langchain_core.messages import HumanMessage
-from llm_client import llm
+from llm_client import get_llm
 from helpers.normalizers import normalize_experience, normalize_skills, normalize_text_field
 from datetime import datetime
 from typing import Dict, Any
@@ -50,10 +50,7 @@ def extract_resume_attributes(text: str) -> Dict[str, Any]:
     """Extract structured attributes from a resume with fixed schema."""
 
     # Work experience calculation
-    total_months = parse_experience_dates(text)
-    years = total_months // 12
-    months = total_months % 12
-    exp_str = f"{years} years {months} months" if years > 0 else f"{months} months"
+    exp_str = experience_string(text)
 
     # LLM prompt: enforce fixed schema
     prompt = f"""
@@ -89,19 +86,41 @@ def extract_resume_attributes(text: str) -> Dict[str, Any]:
     {text}
     """
 
-    resp = llm.invoke([HumanMessage(content=prompt)]).content.strip()
+    resp = get_llm().invoke([HumanMessage(content=prompt)]).content.strip()
 
     # Force JSON validity
     match = re.search(r"\{.*\}", resp, re.DOTALL)
     if match:
         try:
-            parsed = json.loads(match.group())
-            parsed["Years of Experience"] = exp_str  # overwrite with computed value
-            return parsed
+            return validate_resume_attributes(json.loads(match.group()), exp_str)
         except:
             pass
 
     # Fallback (if parsing fails)
+    return empty_resume_attributes(exp_str)
+
+
+def experience_string(text: str) -> str:
+    """Total work experience from the resume's date ranges, e.g. '2 years 3 months'."""
+    total_months = parse_experience_dates(text)
+    years = total_months // 12
+    months = total_months % 12
+    return f"{years} years {months} months" if years > 0 else f"{months} months"
+
+
+def validate_resume_attributes(parsed: Dict[str, Any], exp_str: str) -> Dict[str, Any]:
+    """Fill any field the LLM omitted and overwrite experience with the computed value."""
+    if not isinstance(parsed, dict):
+        raise ValueError("Resume attributes must be a JSON object")
+    result = empty_resume_attributes(exp_str)
+    for key, default in result.items():
+        if key in parsed and isinstance(parsed[key], type(default)):
+            result[key] = parsed[key]
+    result["Years of Experience"] = exp_str  # overwrite with computed value
+    return result
+
+
+def empty_resume_attributes(exp_str: str) -> Dict[str, Any]:
     return {
         "Key Skills": "",
         "Notice Period": "",
@@ -111,4 +130,4 @@ def extract_resume_attributes(text: str) -> Dict[str, Any]:
         "Interpersonal Skills": [],
         "Awards": [],
         "Years of Experience": exp_str
-    }
\ No newline at end of file
+    }
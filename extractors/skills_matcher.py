@@ -1,6 +1,5 @@
 import json
 from langchain_core.messages import HumanMessage
-from llm_client import llm
 from helpers.fuzzy import fuzzy_match
 from langchain_core.prompts import ChatPromptTemplate
 import regex as re
@@ -65,15 +64,18 @@ def llm_find_common_skills(llm, jd_skills: list, resume_skills: list) -> list:
             print("Parsed JSON is not a list.")
             return []
 
-        # Validate against original JD skills to prevent hallucinations
-        validated_skills = [
-            skill for skill in matched_skills
-            if isinstance(skill, str) and fuzzy_match(skill, jd_skills)
-        ]
-
-        return list(set(validated_skills))
+        return validate_matched_skills(matched_skills, jd_skills)
 
     except (json.JSONDecodeError, IndexError, AttributeError) as e:
         print(f"Error parsing LLM response or during validation: {e}")
         print(f"Original LLM response text:\n{text}")
-        return []
\ No newline at end of file
+        return []
+
+
+def validate_matched_skills(matched_skills: list, jd_skills: list) -> list:
+    """Validate against original JD skills to prevent hallucinations."""
+    validated_skills = [
+        skill for skill in matched_skills
+        if isinstance(skill, str) and fuzzy_match(skill, jd_skills)
+    ]
+    return list(set(validated_skills))
@@ -0,0 +1,70 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+# Extracted features (JD/resume summaries + LLM skill match) per scored candidate.
+# Everything /rescore needs to recompute scores without touching the LLM.
+FEATURE_STORE_PATH = os.getenv("FEATURE_STORE_PATH", "feature_store.db")
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(FEATURE_STORE_PATH, check_same_thread=False)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS candidate_features (
+                candidate_id TEXT PRIMARY KEY,
+                created_at REAL NOT NULL,
+                features TEXT NOT NULL
+            )
+        """)
+        _conn.commit()
+    return _conn
+
+
+def save_features(candidate_id: str, state: Dict[str, Any]) -> None:
+    """Persist the LLM-derived features of a finished pipeline run."""
+    features = {
+        "jd_summary": state.get("jd_summary", {}),
+        "resume_summary": state.get("resume_summary", {}),
+        "matched_skills": state.get("matched_skills", []),
+        "missing_skills": state.get("missing_skills", [])
+    }
+    with _lock:
+        conn = _get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO candidate_features (candidate_id, created_at, features) VALUES (?, ?, ?)",
+            (candidate_id, time.time(), json.dumps(features))
+        )
+        conn.commit()
+
+
+def list_candidate_ids() -> List[str]:
+    with _lock:
+        rows = _get_conn().execute("SELECT candidate_id FROM candidate_features").fetchall()
+    return [row[0] for row in rows]
+
+
+def load_features(candidate_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Return {candidate_id: features} for the given ids, or for every stored candidate."""
+    with _lock:
+        conn = _get_conn()
+        if candidate_ids is None:
+            rows = conn.execute("SELECT candidate_id, features FROM candidate_features").fetchall()
+        else:
+            rows = []
+            candidate_ids = list(candidate_ids)
+            for i in range(0, len(candidate_ids), 500):  # stay under SQLite's bound-parameter limit
+                chunk = candidate_ids[i:i + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                rows += conn.execute(
+                    f"SELECT candidate_id, features FROM candidate_features WHERE candidate_id IN ({placeholders})",
+                    chunk
+                ).fetchall()
+    return {candidate_id: json.loads(features) for candidate_id, features in rows}
@@ -1,7 +1,7 @@
-import PyPDF2
-
 def read_pdf(file_path: str) -> str:
     """Extract text from a PDF resume."""
+    import PyPDF2  # imported on first use to keep cold start cheap
+
     text = ""
     with open(file_path, "rb") as f:
         reader = PyPDF2.PdfReader(f)
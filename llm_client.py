@@ -1,8 +1,125 @@
 import os
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
 from dotenv import load_dotenv
-from langchain_groq import ChatGroq
 
 load_dotenv()
 api_key = os.getenv("GROQ_API_KEY")
 
-llm = ChatGroq(model="llama-3.1-8b-instant", api_key=api_key, temperature=0)
+# The Groq client (and langchain-groq itself) is only built on first use, so
+# importing the pipeline stays cheap on cold start.
+_llm = None
+
+
+def get_llm():
+    global _llm
+    if _llm is None:
+        from langchain_groq import ChatGroq
+        _llm = ObservedLLM(ChatGroq(model="llama-3.1-8b-instant", api_key=api_key, temperature=0))
+    return _llm
+
+
+# ---------- Observation / deadlines ----------
+# Callbacks fn(latency_s, rate_limited) run after every real LLM call (from
+# worker threads); the admission controller uses them to adapt concurrency.
+_observers = []
+
+# Monotonic deadline of the current request; LLM calls past it are refused.
+_deadline = contextvars.ContextVar("llm_deadline", default=None)
+# Set (threading.Event) once the request was abandoned; later LLM calls are refused.
+_cancelled = contextvars.ContextVar("llm_cancelled", default=None)
+
+
+class LLMDeadlineExceeded(Exception):
+    pass
+
+
+class LLMCallCancelled(Exception):
+    pass
+
+
+def add_llm_observer(fn) -> None:
+    _observers.append(fn)
+
+
+@contextmanager
+def llm_deadline(deadline: float, cancelled: threading.Event = None):
+    """
+    Refuse LLM calls in this context once time.monotonic() passes `deadline`, or
+    once `cancelled` is set (the request was abandoned while its thread still runs).
+    """
+    token = _deadline.set(deadline)
+    cancel_token = _cancelled.set(cancelled)
+    try:
+        yield
+    finally:
+        _cancelled.reset(cancel_token)
+        _deadline.reset(token)
+
+
+def is_rate_limit_error(e: Exception) -> bool:
+    """Only a real HTTP 429 from the provider; error messages that merely mention 429 don't count."""
+    if getattr(e, "status_code", None) == 429:
+        return True
+    try:
+        from groq import RateLimitError
+    except ImportError:
+        return False
+    return isinstance(e, RateLimitError)
+
+
+class ObservedLLM:
+    """Wraps the chat model: enforces the request deadline / cancellation and reports latency / 429s."""
+
+    def __init__(self, llm):
+        self.llm = llm
+
+    def invoke(self, messages):
+        cancelled = _cancelled.get()
+        if cancelled is not None and cancelled.is_set():
+            raise LLMCallCancelled("Request was cancelled before LLM call")
+        deadline = _deadline.get()
+        if deadline is not None and time.monotonic() >= deadline:
+            raise LLMDeadlineExceeded("Request deadline passed before LLM call")
+
+        start = time.perf_counter()
+        try:
+            resp = self.llm.invoke(messages)
+        except Exception as e:
+            self._notify(time.perf_counter() - start, is_rate_limit_error(e))
+            raise
+        self._notify(time.perf_counter() - start, False)
+        return resp
+
+    def _notify(self, latency: float, rate_limited: bool) -> None:
+        for fn in _observers:
+            fn(latency, rate_limited)
+
+
+class _StubResponse:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class StubLLM:
+    """Offline stand-in for ChatGroq: answers every prompt with a fixed string."""
+
+    def __init__(self, content: str = "{}"):
+        self.content = content
+
+    def invoke(self, messages):
+        return _StubResponse(self.content)
+
+
+@contextmanager
+def override_llm(llm):
+    """Temporarily route every get_llm() call to `llm` (used for warm-up / benchmarks)."""
+    global _llm
+    previous = _llm
+    _llm = llm
+    try:
+        yield llm
+    finally:
+        _llm = previous
@@ -1,14 +1,92 @@
-from langgraph.graph import StateGraph, END
+import os
+import tempfile
+import time
 from state import AgentState
-from scoring.compare import parse_and_compare
-from scoring.rate import rate_resume
 
-workflow = StateGraph(AgentState)
-workflow.add_node("compare", parse_and_compare)
-workflow.add_node("rate", rate_resume)
+# Pipeline modes:
+#   "multi"    - separate JD extraction, resume extraction and skill-matching prompts
+#   "combined" - one structured prompt returns both summaries and the skill match
+#                (fewer round trips, for high-volume screening)
+PIPELINE_MODES = ("multi", "combined")
+DEFAULT_PIPELINE_MODE = os.getenv("PIPELINE_MODE", "multi")
 
-workflow.set_entry_point("compare")
-workflow.add_edge("compare", "rate")
-workflow.add_edge("rate", END)
+# The graph (and LangGraph / LangChain with it) is built on first use, not at
+# import time. app.py compiles it in its startup hook.
+_apps = {}
 
-app = workflow.compile()
+
+# LLM calls a candidate costs in each mode (extraction + skill match + commentary),
+# i.e. what a knock-out saves
+LLM_CALLS_PER_MODE = {"multi": 4, "combined": 2}
+
+
+def build_workflow(mode: str = "multi"):
+    from langgraph.graph import StateGraph, END
+    from scoring.compare import parse_and_compare, parse_and_compare_combined
+    from scoring.knockout import make_knockout_node, route_after_knockout
+    from scoring.rate import rate_resume
+
+    if mode not in PIPELINE_MODES:
+        raise ValueError(f"Unknown pipeline mode: {mode} (expected one of {PIPELINE_MODES})")
+
+    workflow = StateGraph(AgentState)
+    workflow.add_node("knockout", make_knockout_node(LLM_CALLS_PER_MODE[mode]))
+    workflow.add_node("compare", parse_and_compare_combined if mode == "combined" else parse_and_compare)
+    workflow.add_node("rate", rate_resume)
+
+    # Knock-out rules run first on cheap local extraction; disqualified
+    # candidates skip every LLM node
+    workflow.set_entry_point("knockout")
+    workflow.add_conditional_edges("knockout", route_after_knockout, {"knocked_out": END, "continue": "compare"})
+    workflow.add_edge("compare", "rate")
+    workflow.add_edge("rate", END)
+    return workflow
+
+
+def get_app(mode: str = None):
+    mode = mode or DEFAULT_PIPELINE_MODE
+    if mode not in _apps:
+        _apps[mode] = build_workflow(mode).compile()
+    return _apps[mode]
+
+
+def warm_up(mode: str = None) -> float:
+    """
+    Run the compiled graph once end-to-end against a stubbed LLM and a blank PDF,
+    so lazy imports and first-call setup happen before real traffic arrives.
+    Returns the warm-up time in ms.
+    """
+    import PyPDF2
+    from llm_client import StubLLM, override_llm
+
+    start = time.perf_counter()
+    fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer = PyPDF2.PdfWriter()
+            writer.add_blank_page(width=72, height=72)
+            writer.write(f)
+
+        state: AgentState = {
+            "job_description": "",
+            "resume_file": pdf_path,
+            "jd_summary": {},
+            "resume_text": "",
+            "resume_summary": {},
+            "attribute_scores": {},
+            "similarity_score": 0,
+            "rating": "",
+            "comments": ""
+        }
+        with override_llm(StubLLM()):
+            get_app(mode).invoke(state)
+    finally:
+        os.remove(pdf_path)
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def __getattr__(name):
+    # Backwards compatible `from main import app`
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
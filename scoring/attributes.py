@@ -0,0 +1,179 @@
+from typing import Dict, Any, List
+from helpers.fuzzy import fuzzy_match
+
+
+def split_skills(skills: str) -> List[str]:
+    return [s.strip() for s in skills.split(',') if s.strip()]
+
+
+def extract_years(exp_str: str) -> float:
+    nums = [int(x) for x in exp_str.split() if x.isdigit()]
+    if "-" in exp_str:  # handle "2-4 years"
+        parts = exp_str.replace("years", "").replace("year", "").split("-")
+        try:
+            nums = [int(p.strip()) for p in parts if p.strip().isdigit()]
+        except:
+            nums = []
+    if len(nums) == 2:
+        return sum(nums) / 2  # take average for a range
+    return nums[0] if nums else 0
+
+
+def compute_attribute_scores(jd_summary: Dict[str, Any], resume_summary: Dict[str, Any],
+                             matched_skills: List[str], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score a candidate from already-extracted features. No LLM calls, so this can be
+    re-run over stored features whenever the scoring config changes.
+
+    Returns {"attribute_scores", "other_breakdown", "matched_other_requirements"}.
+    """
+    attribute_scores = {}
+    threshold = config["fuzzy_threshold"]
+    direct_points = config["other_requirements_points"]["direct"]
+    partial_points = config["other_requirements_points"]["partial"]
+
+    # 1. Skills Match
+    jd_skills = [s.lower() for s in split_skills(jd_summary.get("Key Skills", ""))]
+    matched_lower = {s.lower() for s in matched_skills}
+
+    if jd_skills:
+        skills_score = (len(matched_lower) / len(jd_skills)) * 100
+    else:
+        skills_score = 100
+
+    attribute_scores["Skills Match"] = round(skills_score, 2)
+
+    # 2. Experience Match % (tolerant scoring)
+    jd_exp_str = str(jd_summary.get("Years of Experience", "0")).replace('+', '').strip()
+    resume_exp_str = str(resume_summary.get("Years of Experience", "0")).replace('+', '').strip()
+
+    jd_years = extract_years(jd_exp_str)
+    resume_years = extract_years(resume_exp_str)
+
+    if jd_years == 0 and resume_years > 0:
+        exp_score = 100  # JD didn’t specify
+    elif resume_years == 0:
+        exp_score = 0  # resume missing -> penalize
+    elif resume_years >= jd_years:
+        exp_score = 100
+    else:
+        exp_score = (resume_years / jd_years) * 100
+
+    attribute_scores["Experience Match"] = round(exp_score, 2)
+
+    # 3. Location Match %
+    jd_loc = jd_summary.get("Location", "").strip().lower()
+    resume_loc = resume_summary.get("Location", "").strip().lower()
+
+    if "remote" in jd_loc:
+        loc_score = 100
+    elif not resume_loc:  # resume missing location -> penalty only if JD needs a specific city
+        loc_score = 0
+    elif "remote" in resume_loc:
+        loc_score = 100
+    else:
+        jd_locs = [l.strip() for l in jd_loc.split(",")]
+        if any(l in resume_loc or resume_loc in l for l in jd_locs if l):
+            loc_score = 100
+        elif jd_loc and resume_loc and jd_loc != resume_loc:
+            loc_score = config["location_partial_score"]
+        else:
+            loc_score = 0
+    attribute_scores["Location Match"] = loc_score
+
+    # 4. Notice Period Match %
+    jd_notice_str = str(jd_summary.get("Notice Period", "30")).strip()
+    resume_notice_str = str(resume_summary.get("Notice Period", "30")).strip()
+
+    try:
+        jd_notice = int(''.join(filter(str.isdigit, jd_notice_str)))
+    except:
+        jd_notice = float('inf')
+
+    try:
+        resume_notice = int(''.join(filter(str.isdigit, resume_notice_str)))
+    except:
+        resume_notice = float('inf')
+
+    if resume_notice == float('inf'):  # missing in resume
+        notice_score = 100  # ignore if missing
+    else:
+        notice_score = 100 if resume_notice <= jd_notice else 0
+    attribute_scores["Notice Period Match"] = notice_score
+
+    # 5. Other Requirements (semantic / fuzzy matching)
+    jd_degrees = [d.strip().lower() for d in jd_summary.get("Degrees", [])]
+    jd_courses = [c.strip().lower() for c in jd_summary.get("Courses", [])]
+    jd_interpersonal_skills = [s.strip().lower() for s in jd_summary.get("Interpersonal Skills", [])]
+    jd_awards = [a.strip().lower() for a in jd_summary.get("Awards", [])]
+
+    def get_list_of_strings(summary_key, default_value=[]):
+        items = resume_summary.get(summary_key, default_value)
+        if all(isinstance(item, dict) for item in items):
+            # Extract degree or course name from dictionaries
+            return [item.get("degree", item.get("course", "")).strip().lower() for item in items]
+        return [str(item).strip().lower() for item in items]
+
+    resume_degrees = get_list_of_strings("Degrees")
+    resume_courses = get_list_of_strings("Courses")
+    resume_interpersonal_skills = get_list_of_strings("Interpersonal Skills")
+    resume_awards = get_list_of_strings("Awards")
+
+    other_breakdown = {}  # Store sub-scores
+    matched_other_requirements = []
+
+    # Degrees, Courses and Awards: one direct match is enough
+    for name, jd_items, resume_items in (
+        ("Degrees", jd_degrees, resume_degrees),
+        ("Courses", jd_courses, resume_courses),
+        ("Awards", jd_awards, resume_awards),
+    ):
+        score = 0
+        if jd_items:
+            match_found = False
+            for jd_item in jd_items:
+                if any(fuzzy_match(jd_item, resume_item, threshold) for resume_item in resume_items):
+                    score = direct_points  # Directly relevant
+                    match_found = True
+                    matched_other_requirements.append(jd_item)
+                    break
+            if not match_found and resume_items:
+                score = partial_points  # Partially relevant
+        elif resume_items:
+            score = direct_points  # JD didn't specify, but resume has it
+        other_breakdown[name] = score
+
+    # Interpersonal Skills: every JD skill has to match for full points
+    interpersonal_skills_score = 0
+    if jd_interpersonal_skills:
+        match_count = 0
+        for jd_s in jd_interpersonal_skills:
+            if any(fuzzy_match(jd_s, resume_s, threshold) for resume_s in resume_interpersonal_skills):
+                match_count += 1
+                matched_other_requirements.append(jd_s)
+        if match_count == len(jd_interpersonal_skills):
+            interpersonal_skills_score = direct_points  # All skills matched
+        elif match_count > 0:
+            interpersonal_skills_score = partial_points  # Some skills matched
+    elif resume_interpersonal_skills:
+        interpersonal_skills_score = direct_points  # JD didn't specify, but resume has some
+    other_breakdown["Interpersonal Skills"] = interpersonal_skills_score
+
+    # Keep the original reporting order
+    other_breakdown = {k: other_breakdown[k] for k in ("Degrees", "Courses", "Interpersonal Skills", "Awards")}
+    other_total_score = sum(other_breakdown.values())
+    attribute_scores["Other Requirements Match"] = round(other_total_score, 2)
+
+    return {
+        "attribute_scores": attribute_scores,
+        "other_breakdown": other_breakdown,
+        "matched_other_requirements": list(set(matched_other_requirements))
+    }
+
+
+def weighted_score(attribute_scores: Dict[str, float], weights: Dict[str, float]) -> float:
+    """Final score (weighted average of attribute scores)."""
+    total = 0
+    for attr, score in attribute_scores.items():
+        total += score * weights.get(attr, 0)
+    return round(total, 2)
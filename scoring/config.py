@@ -0,0 +1,96 @@
+import copy
+import json
+import os
+from typing import Dict, Any
+
+# Single source of truth for everything that turns extracted features into scores.
+# Tune these (or pass overrides to /rescore) instead of editing compare.py / rate.py.
+DEFAULT_SCORING_CONFIG: Dict[str, Any] = {
+    # Weighted average of attribute scores -> similarity_score
+    "weights": {
+        "Skills Match": 0.35,
+        "Experience Match": 0.25,
+        "Location Match": 0.15,
+        "Other Requirements Match": 0.15,
+        "Notice Period Match": 0.10
+    },
+    # Rating buckets, checked top-down: first "min_score" reached wins
+    "rating_buckets": [
+        {"min_score": 80, "rating": "Strong Match"},
+        {"min_score": 50, "rating": "Moderate Match"},
+        {"min_score": 0, "rating": "Weak Match"}
+    ],
+    # Fuzzy matching threshold for degrees / courses / interpersonal skills / awards
+    "fuzzy_threshold": 0.7,
+    # Location score when both locations are known but differ
+    "location_partial_score": 50,
+    # Points per "Other Requirements" category (4 categories -> max 100)
+    "other_requirements_points": {
+        "direct": 25,
+        "partial": 15
+    }
+}
+
+
+def load_scoring_config(overrides: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Build the scoring config: defaults, then the JSON file in $SCORING_CONFIG_PATH
+    (if set), then the given overrides. Nested dicts are merged key by key.
+    """
+    config = copy.deepcopy(DEFAULT_SCORING_CONFIG)
+
+    config_path = os.getenv("SCORING_CONFIG_PATH")
+    if config_path and os.path.exists(config_path):
+        with open(config_path, "r") as f:
+            _merge(config, json.load(f))
+
+    if overrides:
+        _merge(config, overrides)
+
+    _validate(config)
+    config["rating_buckets"] = sorted(config["rating_buckets"], key=lambda b: b["min_score"], reverse=True)
+    return config
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate(config: Dict[str, Any]) -> None:
+    buckets = config["rating_buckets"]
+    if not isinstance(buckets, list) or not buckets:
+        raise ValueError("rating_buckets must be a non-empty list")
+    for bucket in buckets:
+        if (not isinstance(bucket, dict) or not isinstance(bucket.get("rating"), str)
+                or not _is_number(bucket.get("min_score"))):
+            raise ValueError('Each rating bucket needs a numeric "min_score" and a string "rating"')
+    if not isinstance(config["weights"], dict) or not all(_is_number(w) for w in config["weights"].values()):
+        raise ValueError("weights must map attribute names to numbers")
+    if not _is_number(config["fuzzy_threshold"]) or not 0 <= config["fuzzy_threshold"] <= 1:
+        raise ValueError("fuzzy_threshold must be a number between 0 and 1")
+    if not _is_number(config["location_partial_score"]):
+        raise ValueError("location_partial_score must be a number")
+    points = config["other_requirements_points"]
+    if (not isinstance(points, dict) or set(points) != {"direct", "partial"}
+            or not all(_is_number(p) for p in points.values())):
+        raise ValueError('other_requirements_points must be {"direct": <number>, "partial": <number>}')
+
+
+def _merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> None:
+    if not isinstance(overrides, dict):
+        raise ValueError("Scoring config must be a JSON object")
+    for key, value in overrides.items():
+        if key not in base:
+            raise ValueError(f"Unknown scoring config key: {key}")
+        if isinstance(base[key], dict) and isinstance(value, dict):
+            base[key].update(value)
+        else:
+            base[key] = value
+
+
+def rate_score(final_score: float, config: Dict[str, Any]) -> str:
+    """Map a similarity score to its rating bucket."""
+    for bucket in config["rating_buckets"]:
+        if final_score >= bucket["min_score"]:
+            return bucket["rating"]
+    return config["rating_buckets"][-1]["rating"]
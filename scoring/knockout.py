@@ -0,0 +1,266 @@
+import os
+import re
+import json
+import threading
+from typing import Dict, Any, Optional
+from state import AgentState
+from helpers.pdf_utils import read_pdf
+from helpers.normalizers import normalize_text_field
+from scoring.attributes import compute_attribute_scores, weighted_score
+from scoring.config import load_scoring_config
+
+# Knock-out rules per requisition, e.g.
+# {
+#   "requirements": {"Notice Period": "30 days", "Location": "Bangalore, Remote", "Years of Experience": "3 years"},
+#   "min_scores": {"Notice Period Match": 100, "Location Match": 100}
+# }
+# "requirements" play the role of the JD summary, "min_scores" are the minimum
+# attribute scores a candidate must reach. Notice period and location use the same
+# scoring as parse_and_compare; experience is compared in months (see
+# _experience_score) and only when every date range in the resume could be parsed.
+# Notice period requirements are stored normalized to days.
+KNOCKOUT_RULES_PATH = os.getenv("KNOCKOUT_RULES_PATH", "knockout_rules.json")
+KNOCKOUT_RATING = "Disqualified"
+
+# Attribute -> resume field it is computed from. A rule is only applied when the
+# field could be extracted locally; otherwise the candidate goes through the full
+# pipeline rather than being knocked out on missing data.
+KNOCKOUT_ATTRIBUTES = {
+    "Notice Period Match": "Notice Period",
+    "Location Match": "Location",
+    "Experience Match": "Years of Experience"
+}
+
+_rules_lock = threading.Lock()
+_metrics_lock = threading.Lock()
+KNOCKOUT_METRICS = {
+    "screened": 0,
+    "knocked_out": 0,
+    "llm_calls_avoided": 0
+}
+
+
+# ---------- Rules ----------
+def _read_rules_file() -> Dict[str, Any]:
+    if not os.path.exists(KNOCKOUT_RULES_PATH):
+        return {}
+    with open(KNOCKOUT_RULES_PATH, "r") as f:
+        return json.load(f)
+
+
+def load_knockout_rules(requisition_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not requisition_id:
+        return None
+    with _rules_lock:
+        return _read_rules_file().get(requisition_id)
+
+
+def save_knockout_rules(requisition_id: str, rules: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate and persist the knock-out rules of a requisition."""
+    if not isinstance(rules, dict) or set(rules) - {"requirements", "min_scores"}:
+        raise ValueError('Rules must be an object with "requirements" and "min_scores"')
+    requirements = rules.get("requirements", {})
+    min_scores = rules.get("min_scores", {})
+    if not isinstance(requirements, dict) or not isinstance(min_scores, dict):
+        raise ValueError('"requirements" and "min_scores" must be objects')
+
+    normalized = {}
+    for field, value in requirements.items():
+        if field not in KNOCKOUT_ATTRIBUTES.values():
+            raise ValueError(f"Unknown requirement: {field} (expected one of {list(KNOCKOUT_ATTRIBUTES.values())})")
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"Requirement {field} must be a non-empty string")
+        if field == "Notice Period":
+            days = _parse_days(value)
+            if days is None:
+                raise ValueError(f'Could not read Notice Period requirement "{value}" (e.g. "30 days", "2 months")')
+            value = f"{days} days"
+        elif field == "Years of Experience" and _required_months(value) is None:
+            raise ValueError(f'Could not read Years of Experience requirement "{value}" (e.g. "3 years", "18 months")')
+        normalized[field] = normalize_text_field(value)
+
+    for attr, minimum in min_scores.items():
+        if attr not in KNOCKOUT_ATTRIBUTES:
+            raise ValueError(f"Unknown knock-out attribute: {attr} (expected one of {list(KNOCKOUT_ATTRIBUTES)})")
+        if isinstance(minimum, bool) or not isinstance(minimum, (int, float)):
+            raise ValueError(f"Minimum score for {attr} must be a number")
+        if KNOCKOUT_ATTRIBUTES[attr] not in normalized:
+            raise ValueError(f"{attr} needs a \"{KNOCKOUT_ATTRIBUTES[attr]}\" requirement")
+
+    rules = {"requirements": normalized, "min_scores": min_scores}
+    with _rules_lock:
+        all_rules = _read_rules_file()
+        all_rules[requisition_id] = rules
+        tmp_path = KNOCKOUT_RULES_PATH + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(all_rules, f, indent=2)
+        os.replace(tmp_path, KNOCKOUT_RULES_PATH)
+    return rules
+
+
+# ---------- Cheap local extraction ----------
+_DAYS_PER_UNIT = {"day": 1, "week": 7, "month": 30}
+
+
+def _parse_days(value: str) -> Optional[int]:
+    """'30 days' / '2 months' / '1 week' / 'immediate' -> days, None if unreadable."""
+    if re.fullmatch(r"\s*immediate(ly)?(\s+\w+)?\s*", value, re.I):
+        return 0
+    match = re.fullmatch(r"\s*(\d+)\s*(day|week|month)s?\s*", value, re.I)
+    if not match:
+        return None
+    return int(match.group(1)) * _DAYS_PER_UNIT[match.group(2).lower()]
+
+
+def _notice_days(text: str) -> Optional[str]:
+    """
+    Only a "Notice Period: ..." label or an "Immediate joiner" line counts, like
+    _location; a notice period mentioned mid-sentence (e.g. one served at a past
+    employer) is ignored.
+    """
+    if re.search(r"^[ \t]*\bimmediate(ly)?\s+(joiner|joining|available)\b"
+                 r"|^[ \t]*\bnotice\s*period\b[ \t]*[:\-–]?[ \t]*immediate", text, re.I | re.M):
+        return "0 days"
+    match = re.search(r"^[ \t]*\bnotice\s*period\b[ \t]*(?:of|is)?[ \t]*[:\-–]?[ \t]*(\d+)[ \t]*(day|week|month)",
+                      text, re.I | re.M)
+    if not match:
+        return None
+    days = int(match.group(1)) * _DAYS_PER_UNIT[match.group(2).lower()]
+    return f"{days} days"
+
+
+def _location(text: str) -> Optional[str]:
+    """
+    Only an explicit "Location:" / "Current Location:" label at the start of a line
+    counts. If several different locations are labelled (e.g. past employers), the
+    candidate's own one can't be told apart, so nothing is returned.
+    """
+    found = {normalize_text_field(m.group(1))
+             for m in re.finditer(r"^[ \t]*\b(?:current\s+)?location\b[ \t]*:[ \t]*([^\n|•]+)", text, re.I | re.M)}
+    found.discard("")
+    if len(found) != 1:
+        return None
+    return found.pop()
+
+
+# Date ranges parse_experience_dates counts: "(Jan 2024 - Aug 2024)", "(Jan 2025 - Present)"
+_COUNTED_RANGE = re.compile(r"\((\w+\s\d{4})\s*-\s*(\w+\s\d{4}|Present)\)")
+# Any year range, e.g. "2012 - 2023", "Mar 2019 to present", "2018–Current"
+_ANY_RANGE = re.compile(r"\b(?:19|20)\d{2}\s*(?:-|to)\s*(?:[A-Za-z]+\.?\s*)?(?:(?:19|20)\d{2}|present|current|now|date)\b",
+                        re.I)
+
+
+def _has_uncounted_ranges(text: str) -> bool:
+    """
+    True if the resume has job date ranges parse_experience_dates would skip, i.e.
+    its month total is only part of the candidate's experience.
+    """
+    text = text.replace("–", "-").replace("—", "-")
+    return len(_ANY_RANGE.findall(text)) > len(_COUNTED_RANGE.findall(text))
+
+
+def _required_months(requirement: str) -> Optional[int]:
+    """'3 years' / '3+ years' / '2-4 years' / '18 months' -> minimum months, None if unreadable."""
+    match = re.fullmatch(r"\s*(\d+)\s*\+?\s*(?:[-–]\s*\d+\s*)?(year|yr|month)s?\s*", requirement, re.I)
+    if not match:
+        return None
+    return int(match.group(1)) * (1 if match.group(2).lower() == "month" else 12)
+
+
+def _experience_score(candidate_months: int, requirement: str) -> float:
+    """Experience Match in months, same shape as parse_and_compare: 100 if met, else proportional."""
+    required = _required_months(requirement)
+    if not required or candidate_months >= required:
+        return 100
+    return round(candidate_months / required * 100, 2)
+
+
+def local_extract(resume_text: str) -> Dict[str, str]:
+    """Regex-only extraction of the knock-out fields. Fields not found are left out."""
+    from extractors.resume_extractor import parse_experience_dates, experience_string
+
+    found = {}
+    notice = _notice_days(resume_text)
+    if notice is not None:
+        found["Notice Period"] = notice
+    location = _location(resume_text)
+    if location:
+        found["Location"] = location
+    months = parse_experience_dates(resume_text)
+    if months > 0 and not _has_uncounted_ranges(resume_text):
+        found["Years of Experience"] = experience_string(resume_text)
+        found["Experience Months"] = months
+    return found
+
+
+# ---------- Graph nodes ----------
+def make_knockout_node(llm_calls_per_candidate: int):
+    """
+    Build the knock-out node for a pipeline that makes `llm_calls_per_candidate`
+    LLM calls per candidate (used for the "LLM calls avoided" metric).
+    """
+
+    def knockout_check(state: AgentState) -> AgentState:
+        state["knocked_out"] = False
+        state["knockout_reasons"] = []
+
+        rules = load_knockout_rules(state.get("requisition_id"))
+        if not rules or not rules.get("min_scores"):
+            return state
+
+        resume_text = read_pdf(state["resume_file"])
+        state["resume_text"] = resume_text  # reused by the compare node
+
+        # Score the locally extracted fields exactly like parse_and_compare would
+        config = load_scoring_config()
+        local_summary = local_extract(resume_text)
+        requirements = rules.get("requirements", {})
+        scored = compute_attribute_scores(requirements, local_summary, [], config)
+        attribute_scores = scored["attribute_scores"]
+        if "Experience Months" in local_summary:
+            attribute_scores["Experience Match"] = _experience_score(
+                local_summary["Experience Months"], requirements.get("Years of Experience", ""))
+
+        reasons = []
+        for attr, minimum in rules["min_scores"].items():
+            if KNOCKOUT_ATTRIBUTES[attr] not in local_summary:
+                continue  # not found locally -> let the full pipeline decide
+            if attribute_scores[attr] < minimum:
+                reasons.append(f"{attr}: {attribute_scores[attr]}% < required {minimum}% "
+                               f"(candidate: {local_summary[KNOCKOUT_ATTRIBUTES[attr]]}, "
+                               f"required: {requirements.get(KNOCKOUT_ATTRIBUTES[attr], 'n/a')})")
+
+        with _metrics_lock:
+            KNOCKOUT_METRICS["screened"] += 1
+            if reasons:
+                KNOCKOUT_METRICS["knocked_out"] += 1
+                KNOCKOUT_METRICS["llm_calls_avoided"] += llm_calls_per_candidate
+
+        if not reasons:
+            return state
+
+        # Minimal scored result: only the knock-out attributes that were checked
+        checked = {attr: attribute_scores[attr] for attr in rules["min_scores"]
+                   if KNOCKOUT_ATTRIBUTES[attr] in local_summary}
+        state["knocked_out"] = True
+        state["knockout_reasons"] = reasons
+        state["resume_summary"] = local_summary
+        state["attribute_scores"] = checked
+        state["similarity_score"] = weighted_score(checked, config["weights"])
+        state["rating"] = KNOCKOUT_RATING
+        state["comments"] = "**Disqualified by knock-out rules:**\n" + "\n".join(f"- {r}" for r in reasons)
+        print(f"Knocked out: {reasons}")
+        return state
+
+    return knockout_check
+
+
+def route_after_knockout(state: AgentState) -> str:
+    return "knocked_out" if state.get("knocked_out") else "continue"
+
+
+def get_knockout_metrics() -> Dict[str, Any]:
+    with _metrics_lock:
+        metrics = dict(KNOCKOUT_METRICS)
+    metrics["knockout_rate"] = round(metrics["knocked_out"] / metrics["screened"], 4) if metrics["screened"] else 0
+    return metrics
@@ -1,52 +1,20 @@
 from state import AgentState
-from extractors.jd_extractor import extract_jd_attributes
-from extractors.resume_extractor import extract_resume_attributes
-from extractors.skills_matcher import llm_find_common_skills
-from helpers.pdf_utils import read_pdf
-from llm_client import llm
+from scoring.config import load_scoring_config, rate_score
+from llm_client import get_llm
 from langchain_core.messages import HumanMessage
 
 def rate_resume(state: AgentState) -> AgentState:
-    jd = state["job_description"]
-
-    # Summarize JD
-    jd_summary = extract_jd_attributes(jd)
-    state["jd_summary"] = jd_summary
-
-    # Extract text from PDF
-    resume_text = read_pdf(state["resume_file"])
-    state["resume_text"] = resume_text
-
-    # Summarize Resume
-    resume_summary = extract_resume_attributes(resume_text)
-    state["resume_summary"] = resume_summary
-
-    # --- Calculate Attribute Scores ---
-    attribute_scores = {}
-
-    # 1. Skills Match
-    jd_skills_raw = [s.strip() for s in jd_summary.get("Key Skills", "").split(',') if s.strip()]
-    resume_skills_raw = [s.strip() for s in resume_summary.get("Key Skills", "").split(',') if s.strip()]
-
-    # Use original case for LLM
-    matched_skills = llm_find_common_skills(llm, jd_skills_raw, resume_skills_raw)
-    
-    print('Job Description Skills: ',jd_skills_raw)
-    print('Resume Skills: ',resume_skills_raw)
-    print('Common skills between job description and resume: ',matched_skills)
-    missing=list(set(jd_skills_raw)-set(matched_skills))
-    print('Missing skills between job description and resume: ',missing)
-    
+    # Summaries and skill match come from the compare node, so scores, report and
+    # the feature store all see the same extraction (no second round of LLM calls)
+    config = load_scoring_config()
+    matched_skills = state.get("matched_skills", [])
+    missing = state.get("missing_skills", [])
+
     # Use similarity score as final_score
     final_score = state["similarity_score"]
 
     # Rating buckets
-    if final_score >= 80:
-        rating = "Strong Match"
-    elif final_score >= 50:
-        rating = "Moderate Match"
-    else:
-        rating = "Weak Match"
+    rating = rate_score(final_score, config)
 
     # Extract granular scores
     attribute_scores = state["attribute_scores"]
@@ -57,13 +25,7 @@ def rate_resume(state: AgentState) -> AgentState:
     other_score = attribute_scores.get("Other Requirements Match", 0)
 
     # Scoring weights
-    weights = {
-        "Skills Match": 0.35,
-        "Experience Match": 0.25,
-        "Location Match": 0.15,
-        "Notice Period Match": 0.10,
-        "Other Requirements Match": 0.15,
-    }
+    weights = config["weights"]
 
     # Prompt for LLM feedback (includes Other Requirements Match)
     comments_prompt = f"""
@@ -114,7 +76,7 @@ def rate_resume(state: AgentState) -> AgentState:
        - Provide a concise recruiter-focused overview balancing strengths and weaknesses.
        - Avoid repetition, keep it professional and precise.
     """
-    resp = llm.invoke([HumanMessage(content=comments_prompt)])
+    resp = get_llm().invoke([HumanMessage(content=comments_prompt)])
 
     # Save results
     state["rating"] = rating
@@ -131,20 +93,15 @@ def rate_resume(state: AgentState) -> AgentState:
     breakdown += f"Final Score             : {final_score:.2f}% → {rating}\n"
     breakdown += "===================================\n"
 
-    # Add Other Requirements Breakdown (contributions to 9.75%)
+    # Add Other Requirements Breakdown (contributions to the Other Requirements weight)
     if "other_breakdown" in state:
-        other_weight = weights["Other Requirements Match"]  # 0.15
-        sub_max = {
-            "Degrees": 3.75,
-            "Courses": 3.75,
-            "Interpersonal Skills": 3.75,
-            "Awards": 3.75
-        }
+        other_weight = weights.get("Other Requirements Match", 0)
+        sub_max = round(config["other_requirements_points"]["direct"] * other_weight, 2)
         breakdown += "\n--- Other Requirements Breakdown ---\n"
         for sub, sc in state["other_breakdown"].items():
             # Calculate contribution to the final score
             contribution = round(sc * other_weight, 2)
-            breakdown += f"  {sub:<20}: Total: {sub_max[sub]}% → Contribution: {contribution}%\n"
+            breakdown += f"  {sub:<20}: Total: {sub_max}% → Contribution: {contribution}%\n"
         breakdown += "-----------------------------------\n"
 
     print(breakdown)  # for console / logs
@@ -0,0 +1,72 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+from feature_store import list_candidate_ids, load_features
+from scoring.attributes import compute_attribute_scores, weighted_score
+from scoring.config import load_scoring_config, rate_score
+
+# Attribute scores only depend on the features and on the non-weight part of the
+# config, so sweeping weights / rating buckets is just arithmetic over this cache.
+# Candidate ids are never reused, so entries don't go stale. Only the most recent
+# attribute configs are kept (LRU), so threshold sweeps don't grow memory forever.
+MAX_CACHED_CONFIGS = 4
+_attribute_cache: "OrderedDict[tuple, Dict[str, Dict[str, float]]]" = OrderedDict()
+# /rescore runs in worker threads; one rescore at a time touches the cache
+_cache_lock = threading.Lock()
+
+
+def _attribute_config_key(config: Dict[str, Any]) -> tuple:
+    return (
+        config["fuzzy_threshold"],
+        config["location_partial_score"],
+        config["other_requirements_points"]["direct"],
+        config["other_requirements_points"]["partial"]
+    )
+
+
+def rescore_candidates(overrides: Optional[Dict[str, Any]] = None,
+                       candidate_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Recompute attribute_scores, similarity_score and rating for stored candidates
+    with a new scoring config. Pure local computation, no LLM calls.
+    """
+    start = time.perf_counter()
+    config = load_scoring_config(overrides)
+    key = _attribute_config_key(config)
+
+    if candidate_ids is None:
+        candidate_ids = list_candidate_ids()
+
+    with _cache_lock:
+        cache = _attribute_cache.pop(key, {})
+        _attribute_cache[key] = cache  # most recently used last
+        while len(_attribute_cache) > MAX_CACHED_CONFIGS:
+            _attribute_cache.popitem(last=False)
+
+        uncached = [c for c in candidate_ids if c not in cache]
+        if uncached:
+            for candidate_id, f in load_features(uncached).items():
+                scored = compute_attribute_scores(f["jd_summary"], f["resume_summary"], f["matched_skills"], config)
+                cache[candidate_id] = scored["attribute_scores"]
+
+        results = []
+        for candidate_id in candidate_ids:
+            attribute_scores = cache.get(candidate_id)
+            if attribute_scores is None:  # unknown candidate id
+                continue
+            similarity_score = weighted_score(attribute_scores, config["weights"])
+            results.append({
+                "candidate_id": candidate_id,
+                "attribute_scores": attribute_scores,
+                "similarity_score": similarity_score,
+                "rating": rate_score(similarity_score, config)
+            })
+
+    results.sort(key=lambda r: r["similarity_score"], reverse=True)
+    return {
+        "config": config,
+        "count": len(results),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+        "results": results
+    }
@@ -1,12 +1,20 @@
-from typing import TypedDict, Dict, Any
+from typing import TypedDict, Dict, Any, List
 
 class AgentState(TypedDict):
     job_description: str
+    requisition_id: str
     jd_summary: Dict[str, str]
     resume_file: str
     resume_text: str
     resume_summary: Dict[str, str]
+    matched_skills: List[str]
+    missing_skills: List[str]
+    matched_other_requirements: List[str]
+    other_breakdown: Dict[str, float]
     attribute_scores: Dict[str, float]
     similarity_score: float
     rating: str
     comments: str
+    score_breakdown: str
+    knocked_out: bool
+    knockout_reasons: List[str]
@@ -0,0 +1,153 @@
+import asyncio
+import math
+import time
+import pytest
+from admission import AdmissionController, AdmissionRejected, parse_timeout_ms, ADMISSION_MAX_TIMEOUT_S
+
+
+def _deadline(seconds: float = 10) -> float:
+    return time.monotonic() + seconds
+
+
+# ---------- Admission / queueing ----------
+def test_queue_full_is_rejected():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, max_queue=1)
+        await controller.acquire(_deadline())
+        queued = asyncio.ensure_future(controller.acquire(_deadline()))
+        await asyncio.sleep(0)
+        assert controller.is_saturated()
+
+        with pytest.raises(AdmissionRejected) as exc:
+            await controller.acquire(_deadline())
+        assert "queue is full" in exc.value.reason
+        assert exc.value.retry_after >= 1
+        assert controller.stats["rejected_queue_full"] == 1
+
+        controller.release()
+        await queued  # the queued request gets the freed slot
+        assert controller.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_retry_after_from_queue_length_and_request_time():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=2, max_queue=8, target_llm_latency=5)
+        assert controller.retry_after() == math.ceil(5 * 1 / 2)  # no request timed yet
+
+        await controller.acquire(_deadline())
+        await controller.acquire(_deadline())
+        controller.release(duration=4.0)
+        await controller.acquire(_deadline())
+        waiters = [asyncio.ensure_future(controller.acquire(_deadline())) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        # (3 queued + this one) requests of ~4 s over 2 slots
+        assert controller.retry_after() == math.ceil(4.0 * 4 / 2)
+        for w in waiters:
+            w.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+# ---------- AIMD ----------
+def test_backs_off_on_rate_limit_with_cooldown():
+    controller = AdmissionController(max_concurrency=10, cooldown=5)
+    controller.observe_llm_call(0.1, rate_limited=True)
+    assert controller.limit == pytest.approx(7.0)
+
+    controller.observe_llm_call(0.1, rate_limited=True)  # within cooldown
+    assert controller.limit == pytest.approx(7.0)
+
+    controller._last_decrease -= 10
+    controller.observe_llm_call(0.1, rate_limited=True)
+    assert controller.limit == pytest.approx(4.9)
+
+
+def test_backs_off_on_slow_llm_and_never_below_minimum():
+    controller = AdmissionController(max_concurrency=2, min_concurrency=1, target_llm_latency=1, cooldown=0)
+    for _ in range(5):
+        controller.observe_llm_call(3.0, rate_limited=False)
+    assert controller.limit == 1
+    assert controller.current_limit() == 1
+
+
+def test_recovers_additively_up_to_maximum():
+    controller = AdmissionController(max_concurrency=4, cooldown=0)
+    controller.observe_llm_call(0.1, rate_limited=True)
+    assert controller.current_limit() == 2
+
+    controller.observe_llm_call(0.1, rate_limited=False)
+    assert controller.limit == pytest.approx(2.8 + 1 / 2.8)
+
+    for _ in range(50):
+        controller.observe_llm_call(0.1, rate_limited=False)
+    assert controller.limit == 4
+
+
+def test_limit_increase_admits_queued_waiters():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=2, cooldown=0)
+        controller.observe_llm_call(0.1, rate_limited=True)
+        assert controller.current_limit() == 1
+
+        await controller.acquire(_deadline())
+        waiter = asyncio.ensure_future(controller.acquire(_deadline()))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        # Healthy calls reported from a worker thread raise the limit to 2
+        def healthy_calls():
+            while controller.current_limit() < 2:
+                controller.observe_llm_call(0.1, rate_limited=False)
+        await asyncio.to_thread(healthy_calls)
+
+        await asyncio.wait_for(waiter, 1)  # admitted without any release()
+        assert controller.in_flight == 2
+
+    asyncio.run(scenario())
+
+
+# ---------- Dead waiters ----------
+def test_timed_out_waiters_do_not_count_as_queued():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, max_queue=2)
+        await controller.acquire(time.monotonic() + 10)  # long in-flight request
+
+        for _ in range(2):
+            with pytest.raises(AdmissionRejected):
+                await controller.acquire(time.monotonic() + 0.01)
+
+        assert not controller.is_saturated()
+        assert controller.snapshot()["queued"] == 0
+        assert len(controller._waiters) == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_is_removed():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, max_queue=1)
+        await controller.acquire(time.monotonic() + 10)
+        task = asyncio.ensure_future(controller.acquire(time.monotonic() + 10))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not controller.is_saturated()
+
+    asyncio.run(scenario())
+
+
+# ---------- Client timeouts ----------
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf", "0", "-5", "abc"])
+def test_parse_timeout_rejects_bad_values(value):
+    with pytest.raises(ValueError):
+        parse_timeout_ms(value)
+
+
+def test_parse_timeout_caps_at_server_maximum():
+    assert parse_timeout_ms("1500") == 1.5
+    assert parse_timeout_ms(str(10 ** 12)) == ADMISSION_MAX_TIMEOUT_S
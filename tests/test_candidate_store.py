@@ -0,0 +1,138 @@
+import csv
+import math
+import multiprocessing
+import pytest
+import candidate_store
+from candidate_store import CandidateStore, get_store
+
+
+def candidate(score, skills=70, months=None, rating="Moderate Match", matched=("Python",), missing=("AWS",)):
+    state = {
+        "attribute_scores": {"Skills Match": skills, "Experience Match": 100, "Location Match": 50,
+                             "Notice Period Match": 100, "Other Requirements Match": 40},
+        "similarity_score": score,
+        "rating": rating,
+        "matched_skills": list(matched),
+        "missing_skills": list(missing),
+    }
+    if months is not None:
+        state["resume_summary"] = {"Years of Experience": f"{months // 12} years {months % 12} months"}
+    return state
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandidateStore(str(tmp_path / "req-1"))
+
+
+def ids(page):
+    return [c["candidate_id"] for c in page["candidates"]]
+
+
+# ---------- Appends / top-K ----------
+def test_add_and_read_back(store):
+    store.add(candidate(72.5, months=27, matched=["Python", "SQL"], missing=["Docker"]), "a")
+    row = store.top_k()["candidates"][0]
+    assert row["candidate_id"] == "a"
+    assert row["similarity_score"] == 72.5
+    assert row["experience_months"] == 27
+    assert row["matched_skills"] == ["Python", "SQL"]
+    assert row["missing_skills"] == ["Docker"]
+
+    # A fresh instance (another worker) sees the same data
+    assert ids(CandidateStore(store.path).top_k()) == ["a"]
+
+
+def test_paging_with_ties_keeps_insertion_order(store):
+    store.add_many([(candidate(s), c) for c, s in
+                    [("a", 50), ("b", 80), ("c", 80), ("d", 60), ("e", 80), ("f", 10)]])
+    pages = [ids(store.top_k(k=2, offset=o)) for o in (0, 2, 4, 6)]
+    assert pages == [["b", "c"], ["e", "d"], ["a", "f"], []]
+    assert store.top_k(k=2, offset=4)["total"] == 6
+
+
+def test_min_filters_rating_and_sort_by(store):
+    store.add_many([(candidate(90, skills=40, months=60), "a"),
+                    (candidate(70, skills=80, months=12), "b"),
+                    (candidate(60, skills=90, months=36, rating="Weak Match"), "c")])
+    assert ids(store.top_k(min_scores={"skills_match": 70})) == ["b", "c"]
+    assert ids(store.top_k(min_scores={"skills_match": 70, "experience_months": 24})) == ["c"]
+    assert ids(store.top_k(rating="Weak Match")) == ["c"]
+    assert ids(store.top_k(rating="Unknown")) == []
+    assert ids(store.top_k(sort_by="experience_months")) == ["a", "c", "b"]
+
+    with pytest.raises(ValueError):
+        store.top_k(min_scores={"resume_text": 1})
+    with pytest.raises(ValueError):
+        store.top_k(sort_by="candidate_id")
+    with pytest.raises(ValueError):
+        store.top_k(k=0)
+
+
+def test_unchecked_attributes_of_knocked_out_candidates_are_missing(store):
+    store.add(candidate(60, skills=50), "scored")
+    store.add({"attribute_scores": {"Notice Period Match": 0}, "similarity_score": 0,
+               "rating": "Disqualified"}, "knocked_out")
+
+    rows = {c["candidate_id"]: c for c in store.top_k()["candidates"]}
+    assert rows["knocked_out"]["skills_match"] is None
+    assert rows["knocked_out"]["notice_period_match"] == 0
+    assert ids(store.top_k(sort_by="skills_match")) == ["scored", "knocked_out"]
+    assert ids(store.top_k(min_scores={"skills_match": 0})) == ["scored"]
+
+
+# ---------- Export ----------
+def test_csv_export(store, tmp_path):
+    store.add(candidate(80, matched=["Python", "SQL"]), "a")
+    store.add({"attribute_scores": {"Location Match": 0}, "similarity_score": 0, "rating": "Disqualified"}, "b")
+
+    path = store.export(str(tmp_path / "out.csv"), "csv")
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["candidate_id"] for r in rows] == ["a", "b"]
+    assert rows[0]["matched_skills"] == "Python; SQL"
+    assert float(rows[0]["similarity_score"]) == 80
+    assert rows[1]["skills_match"] == ""  # not scored, not 0
+
+    with pytest.raises(ValueError):
+        store.export(str(tmp_path / "out.xlsx"), "xlsx")
+
+
+# ---------- get_store ----------
+def test_get_store_only_creates_when_asked(tmp_path, monkeypatch):
+    monkeypatch.setattr(candidate_store, "CANDIDATE_STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(candidate_store, "_stores", {})
+
+    assert get_store("req-404") is None
+    assert not (tmp_path / "req-404").exists()
+    assert candidate_store._stores == {}
+
+    created = get_store("req-1", create=True)
+    assert get_store("req-1") is created
+    with pytest.raises(ValueError):
+        get_store("../etc")
+
+
+# ---------- Multi-process appends ----------
+def _append_rows(path, worker, rows):
+    store = CandidateStore(path)
+    for i in range(rows):
+        store.add(candidate(i % 100, matched=[f"skill-{worker}-{i % 7}"]), f"{worker}-{i}")
+
+
+def test_two_processes_append_concurrently(store):
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_append_rows, args=(store.path, w, 150)) for w in range(2)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join(60)
+        assert p.exitcode == 0
+
+    page = store.top_k(k=500)
+    assert page["total"] == 300
+    assert sorted(ids(page)) == sorted(f"{w}-{i}" for w in range(2) for i in range(150))
+    for row in page["candidates"]:
+        worker, i = map(int, row["candidate_id"].split("-"))
+        assert row["matched_skills"] == [f"skill-{worker}-{i % 7}"]
+        assert math.isclose(row["similarity_score"], i % 100)
@@ -0,0 +1,29 @@
+import pytest
+from scoring.config import load_scoring_config, rate_score
+
+
+@pytest.mark.parametrize("overrides", [
+    {"location_partial_score": "50"},
+    {"fuzzy_threshold": 2},
+    {"fuzzy_threshold": None},
+    {"other_requirements_points": {"direct": "25"}},
+    {"other_requirements_points": {"bonus": 5}},
+    {"other_requirements_points": 25},
+    {"weights": {"Skills Match": "0.5"}},
+    {"rating_buckets": []},
+    {"rating_buckets": [{"min_score": "80", "rating": "Strong Match"}]},
+    {"unknown_key": 1},
+])
+def test_invalid_overrides_rejected(overrides):
+    with pytest.raises(ValueError):
+        load_scoring_config(overrides)
+
+
+def test_nested_overrides_merge_and_buckets_sorted():
+    config = load_scoring_config({
+        "other_requirements_points": {"direct": 30},
+        "rating_buckets": [{"min_score": 0, "rating": "Low"}, {"min_score": 90, "rating": "High"}]
+    })
+    assert config["other_requirements_points"] == {"direct": 30, "partial": 15}
+    assert rate_score(95, config) == "High"
+    assert rate_score(40, config) == "Low"
@@ -0,0 +1,99 @@
+import pytest
+import scoring.knockout as knockout
+from scoring.knockout import _location, _notice_days, _experience_score, _has_uncounted_ranges, save_knockout_rules
+
+
+# ---------- _location ----------
+@pytest.mark.parametrize("text", [
+    "Open to relocation - yes",
+    "Power electricity - 5 yrs",
+    "Relocation: yes",
+    "Preferred city - Pune",
+    "Worked on location-based services: maps, geofencing",
+])
+def test_location_ignores_unlabelled_mentions(text):
+    assert _location(text) is None
+
+
+def test_location_reads_labelled_line():
+    assert _location("Jane Doe\nLocation: Bangalore, India\nSkills: Python") == "Bangalore, India"
+    assert _location("  Current Location : Pune\n") == "Pune"
+
+
+def test_location_skipped_when_past_employers_list_locations():
+    text = ("Current Location: Pune\n"
+            "Experience\n"
+            "Acme Corp (Jan 2020 - Dec 2022)\n"
+            "Location: Mumbai\n")
+    assert _location(text) is None
+
+
+def test_location_same_city_twice_is_fine():
+    assert _location("Location: Pune\n...\nLocation: Pune\n") == "Pune"
+
+
+# ---------- _notice_days ----------
+@pytest.mark.parametrize("text, expected", [
+    ("Notice Period: 30 days", "30 days"),
+    ("notice period of 2 months", "60 days"),
+    ("Immediate joiner", "0 days"),
+    ("No notice information", None),
+    ("Served notice period of 3 months at Acme before joining Foo", None),
+    ("Acme (Jan 2020 - Dec 2022)\n  Notice Period - 1 month\n", "30 days"),
+    ("Notice period: immediate", "0 days"),
+])
+def test_notice_days(text, expected):
+    assert _notice_days(text) == expected
+
+
+# ---------- _experience_score ----------
+@pytest.mark.parametrize("months, requirement, expected", [
+    (36, "3 years", 100),        # "3 years 0 months"
+    (8, "3 years", 22.22),       # "8 months" is not 8 years
+    (61, "3 years", 100),        # "5 years 1 months"
+    (18, "2-4 years", 75),       # range -> minimum
+    (12, "18 months", 66.67),
+])
+def test_experience_score_in_months(months, requirement, expected):
+    assert _experience_score(months, requirement) == expected
+
+
+# ---------- _has_uncounted_ranges ----------
+@pytest.mark.parametrize("text, expected", [
+    ("Location: Bangalore\nAcme (Jan 2024 - Present)\nFoo Corp 2012 - 2023", True),
+    ("Acme (Jan 2020 – Dec 2022)\nFoo (Mar 2015 to present)", True),
+    ("Acme (Jan 2024 - Present)\nFoo Corp (Feb 2012 - Dec 2023)", False),
+    ("B.Tech, 2008 - 2012\nAcme (Jan 2013 - Present)", True),  # can't tell education from jobs
+    ("No dates at all", False),
+])
+def test_uncounted_ranges(text, expected):
+    assert _has_uncounted_ranges(text) is expected
+
+
+# ---------- save_knockout_rules ----------
+@pytest.fixture
+def rules_path(tmp_path, monkeypatch):
+    path = tmp_path / "knockout_rules.json"
+    monkeypatch.setattr(knockout, "KNOCKOUT_RULES_PATH", str(path))
+    return path
+
+
+def test_notice_requirement_normalized_to_days(rules_path):
+    rules = save_knockout_rules("req-1", {"requirements": {"Notice Period": "2 months"},
+                                          "min_scores": {"Notice Period Match": 100}})
+    assert rules["requirements"]["Notice Period"] == "60 days"
+
+
+@pytest.mark.parametrize("rules", [
+    {"requirements": {"Location": 5}, "min_scores": {"Location Match": 100}},
+    {"requirements": {"Location": "Pune"}, "min_scores": [100]},
+    {"requirements": ["Location"], "min_scores": {}},
+    {"requirements": {"Notice Period": "soon"}, "min_scores": {"Notice Period Match": 100}},
+    {"requirements": {"Years of Experience": "senior"}, "min_scores": {"Experience Match": 100}},
+    {"requirements": {"Location": "Pune"}, "min_scores": {"Location Match": "100"}},
+    {"requirements": {}, "min_scores": {"Location Match": 100}},
+])
+def test_invalid_rules_rejected(rules_path, rules):
+    with pytest.raises(ValueError):
+        save_knockout_rules("req-1", rules)
+    assert not rules_path.exists()
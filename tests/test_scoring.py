@@ -0,0 +1,112 @@
+from collections import OrderedDict
+import pytest
+import feature_store
+import scoring.rescore as rescore
+from scoring.attributes import compute_attribute_scores, weighted_score
+from scoring.config import load_scoring_config
+
+JD_BACKEND = {
+    "Key Skills": "Python, SQL, AWS, Docker", "Years of Experience": "3+ years", "Location": "Bangalore, Pune",
+    "Notice Period": "30 days", "Degrees": ["B.Tech Computer Science"], "Courses": ["AWS Certified Developer"],
+    "Interpersonal Skills": ["communication", "teamwork"], "Awards": []
+}
+RESUME_BACKEND = {
+    "Key Skills": "Python, SQL, Java", "Years of Experience": "2 years 10 months", "Location": "Pune",
+    "Notice Period": "60 days", "Degrees": [{"degree": "B.Tech in Computer Science", "institute": "X"}],
+    "Courses": [{"course": "Docker Mastery", "provider": "Udemy"}],
+    "Interpersonal Skills": ["Communication", "Leadership"], "Awards": ["Best Employee 2021"]
+}
+JD_FRONTEND = {
+    "Key Skills": "React, TypeScript", "Years of Experience": "2-4 years", "Location": "Mumbai",
+    "Notice Period": "", "Degrees": [], "Courses": [], "Interpersonal Skills": [], "Awards": []
+}
+RESUME_FRONTEND = {
+    "Key Skills": "React", "Years of Experience": "8 months", "Location": "Delhi",
+    "Notice Period": "Immediate", "Degrees": [], "Courses": [], "Interpersonal Skills": [], "Awards": []
+}
+JD_REMOTE = {
+    "Key Skills": "", "Years of Experience": "", "Location": "Remote", "Notice Period": "15 days",
+    "Degrees": ["MBA"], "Courses": [], "Interpersonal Skills": ["leadership"], "Awards": ["Hackathon winner"]
+}
+RESUME_REMOTE = {
+    "Key Skills": "Excel", "Years of Experience": "5 years 0 months", "Location": "", "Notice Period": "15 days",
+    "Degrees": ["B.Com"], "Courses": [], "Interpersonal Skills": ["leadership"], "Awards": ["Hackathon Winner 2020"]
+}
+
+# Expected numbers were produced by running the pre-refactor parse_and_compare
+# (scoring/compare.py before the scoring config existed) on the same features.
+PARITY_CASES = [
+    (JD_BACKEND, RESUME_BACKEND, ["Python", "SQL"],
+     {"Skills Match": 50.0, "Experience Match": 100, "Location Match": 100,
+      "Notice Period Match": 0, "Other Requirements Match": 55},
+     {"Degrees": 15, "Courses": 15, "Interpersonal Skills": 0, "Awards": 25}, 65.75),
+    (JD_FRONTEND, RESUME_FRONTEND, ["React"],
+     {"Skills Match": 50.0, "Experience Match": 100, "Location Match": 50,
+      "Notice Period Match": 100, "Other Requirements Match": 0},
+     {"Degrees": 0, "Courses": 0, "Interpersonal Skills": 0, "Awards": 0}, 60.0),
+    (JD_REMOTE, RESUME_REMOTE, [],
+     {"Skills Match": 100, "Experience Match": 100, "Location Match": 100,
+      "Notice Period Match": 100, "Other Requirements Match": 30},
+     {"Degrees": 15, "Courses": 0, "Interpersonal Skills": 0, "Awards": 15}, 89.5),
+]
+
+
+# ---------- compute_attribute_scores ----------
+@pytest.mark.parametrize("jd, resume, matched, attribute_scores, other_breakdown, similarity", PARITY_CASES)
+def test_default_config_matches_original_parse_and_compare(jd, resume, matched, attribute_scores,
+                                                           other_breakdown, similarity):
+    config = load_scoring_config()
+    scored = compute_attribute_scores(jd, resume, matched, config)
+    assert scored["attribute_scores"] == attribute_scores
+    assert list(scored["other_breakdown"].items()) == list(other_breakdown.items())
+    assert weighted_score(scored["attribute_scores"], config["weights"]) == similarity
+
+
+def test_config_changes_attribute_scores():
+    config = load_scoring_config({"location_partial_score": 20, "other_requirements_points": {"partial": 10}})
+    scores = compute_attribute_scores(JD_FRONTEND, RESUME_FRONTEND, ["React"], config)["attribute_scores"]
+    assert scores["Location Match"] == 20
+    scores = compute_attribute_scores(JD_BACKEND, RESUME_BACKEND, ["Python", "SQL"], config)["attribute_scores"]
+    assert scores["Other Requirements Match"] == 10 + 10 + 25
+
+
+# ---------- rescore_candidates ----------
+@pytest.fixture
+def stored_candidates(tmp_path, monkeypatch):
+    monkeypatch.setattr(feature_store, "FEATURE_STORE_PATH", str(tmp_path / "features.db"))
+    monkeypatch.setattr(feature_store, "_conn", None)
+    monkeypatch.setattr(rescore, "_attribute_cache", OrderedDict())
+    for candidate_id, (jd, resume, matched, *_) in zip(("backend", "frontend", "remote"), PARITY_CASES):
+        feature_store.save_features(candidate_id, {"jd_summary": jd, "resume_summary": resume,
+                                                   "matched_skills": matched})
+    yield
+    feature_store._conn.close()
+
+
+def test_rescore_with_defaults_reproduces_pipeline_scores(stored_candidates):
+    results = {r["candidate_id"]: r for r in rescore.rescore_candidates()["results"]}
+    assert {c: r["similarity_score"] for c, r in results.items()} == {"backend": 65.75, "frontend": 60.0,
+                                                                      "remote": 89.5}
+    assert results["remote"]["rating"] == "Strong Match"
+    assert results["backend"]["rating"] == "Moderate Match"
+
+
+def test_weight_change_rerates_stored_candidates(stored_candidates):
+    result = rescore.rescore_candidates({"weights": {"Skills Match": 1, "Experience Match": 0, "Location Match": 0,
+                                                     "Other Requirements Match": 0, "Notice Period Match": 0}})
+    scores = {r["candidate_id"]: (r["similarity_score"], r["rating"]) for r in result["results"]}
+    assert scores == {"backend": (50.0, "Moderate Match"), "frontend": (50.0, "Moderate Match"),
+                      "remote": (100.0, "Strong Match")}
+
+
+def test_bucket_change_rerates_stored_candidates(stored_candidates):
+    rescore.rescore_candidates()
+    result = rescore.rescore_candidates({"rating_buckets": [{"min_score": 62, "rating": "Shortlist"},
+                                                            {"min_score": 0, "rating": "Reject"}]},
+                                        candidate_ids=["backend", "frontend", "unknown"])
+    assert [(r["candidate_id"], r["rating"]) for r in result["results"]] == [("backend", "Shortlist"),
+                                                                             ("frontend", "Reject")]
+    assert len(rescore._attribute_cache) == 1  # only buckets changed: cached attribute scores reused
+
+    rescore.rescore_candidates({"fuzzy_threshold": 0.9})
+    assert len(rescore._attribute_cache) == 2